@@ -1,12 +1,17 @@
 # app/api/routes/alerts.py - Complete alerts routes
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request, UploadFile, File, Depends, HTTPException, Query
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from datetime import datetime
-import json
+from functools import lru_cache
 import logging
+import time
 
+from pydantic import ValidationError
+
+from app.core.responses import ORJSONResponse
 from app.database.db import get_db
+from app.schemas.alert import ShelfPayload
 from app.services.alert_service import AlertService
 from app.models.employee import Employee
 from app.models.alert import Alert, AlertType, AlertStatus, AlertPriority
@@ -15,8 +20,70 @@ from app.models.alert_history import AlertHistory
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Uploaded alert payloads are small JSON documents; anything bigger is
+# rejected before it is read into memory
+MAX_UPLOAD_BYTES = 1_048_576
+
+
+# Query-string filter values repeat across requests, so coerce them to enum
+# members through small caches instead of re-running the exception path.
+# Lookup is by member name: the enum values are lowercase, so the old
+# Enum(value.upper()) call could never match anything
+@lru_cache(maxsize=64)
+def _priority_filter(value: str) -> Optional[AlertPriority]:
+    try:
+        return AlertPriority[value.upper()]
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _status_filter(value: str) -> Optional[AlertStatus]:
+    try:
+        return AlertStatus[value.upper()]
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _type_filter(value: str) -> Optional[AlertType]:
+    try:
+        return AlertType[value.upper()]
+    except KeyError:
+        return None
+
+
+# Employee records rarely change, so validated lookups are cached briefly and
+# the mutation endpoints skip their per-request existence SELECT
+_EMPLOYEE_CACHE_TTL = 60.0
+_employee_cache = {}
+
+
+def _get_employee_info(db: Session, employee_id: str) -> Optional[dict]:
+    cached = _employee_cache.get(employee_id)
+    if cached and time.monotonic() - cached[0] < _EMPLOYEE_CACHE_TTL:
+        return cached[1]
+
+    employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
+    if not employee:
+        return None
+
+    info = {
+        "employee_id": employee.employee_id,
+        "username": employee.username,
+        "role": employee.role
+    }
+    _employee_cache[employee_id] = (time.monotonic(), info)
+    return info
+
+
+# Column projection matching Alert.to_dict, used by the hot list endpoints to
+# skip ORM hydration and serialize rows straight through orjson
+_ALERT_COLUMNS = Alert.projection_columns()
+
 @router.post("/process")
 async def process_alerts(
+    request: Request,
     file: UploadFile = File(...), 
     db: Session = Depends(get_db)
 ):
@@ -27,39 +94,35 @@ async def process_alerts(
         if not file.filename.endswith('.json'):
             raise HTTPException(status_code=400, detail="Only JSON files are supported")
         
-        # Read and parse JSON data
+        # Short-circuit oversized uploads before reading the body
+        content_length = int(request.headers.get("content-length", "0") or 0)
+        if content_length > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        
+        # Read and validate in one pass via pydantic-core's JSON parser
         try:
             content = await file.read()
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON format: {str(e)}")
-            raise HTTPException(status_code=400, detail=f"Invalid JSON format: {str(e)}")
+            if len(content) > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="Payload too large")
+            payload = ShelfPayload.model_validate_json(content)
+        except HTTPException:
+            # Don't let the generic handler rewrite the 413 into a 400
+            raise
+        except ValidationError as e:
+            logger.error("Invalid payload: %s", e)
+            raise HTTPException(status_code=400, detail=f"Invalid payload: {str(e)}")
         except Exception as e:
-            logger.error(f"Error reading file: {str(e)}")
+            logger.error("Error reading file: %s", e)
             raise HTTPException(status_code=400, detail=f"Error reading file: {str(e)}")
-        
-        # Validate JSON structure for new format
-        required_fields = ["shelf_number", "empty_percentage", "items_detected"]
-        for field in required_fields:
-            if field not in data:
-                raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
-        
-        # Validate data types
-        if not isinstance(data["shelf_number"], str):
-            raise HTTPException(status_code=400, detail="shelf_number must be a string")
-        
-        if not isinstance(data["empty_percentage"], (int, float)):
-            raise HTTPException(status_code=400, detail="empty_percentage must be a number")
-        
-        if not isinstance(data["items_detected"], list):
-            raise HTTPException(status_code=400, detail="items_detected must be an array")
-        
+
+        data = payload.model_dump()
+
         # Process alerts using AlertService
         alert_service = AlertService(db)
         result = alert_service.process_json_data(data)
         
         if not result["success"]:
-            logger.error(f"Alert processing failed: {result['error']}")
+            logger.error("Alert processing failed: %s", result["error"])
             raise HTTPException(status_code=500, detail=f"Alert processing failed: {result['error']}")
         
         # Return success response
@@ -72,15 +135,15 @@ async def process_alerts(
         # Include errors if any (non-critical)
         if result["errors"]:
             response["warnings"] = result["errors"]
-            logger.warning(f"Processing completed with warnings: {result['errors']}")
+            logger.warning("Processing completed with warnings: %s", result["errors"])
         
-        logger.info(f"Successfully processed {result['alerts_created']} alerts")
+        logger.info("Successfully processed %d alerts", result["alerts_created"])
         return response
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error processing alerts: {str(e)}")
+        logger.exception("Unexpected error processing alerts")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @router.get("/active")
@@ -96,42 +159,36 @@ async def get_active_alerts(
     
     try:
         alert_service = AlertService(db)
-        
-        # Get base active alerts
-        alerts = alert_service.get_active_alerts(employee_id)
-        
-        # Apply additional filters
-        if priority:
-            try:
-                priority_enum = AlertPriority(priority.upper())
-                alerts = [alert for alert in alerts if alert.priority == priority_enum]
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid priority: {priority}")
-        
-        if alert_type:
-            try:
-                type_enum = AlertType(alert_type.upper())
-                alerts = [alert for alert in alerts if alert.alert_type == type_enum]
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid alert type: {alert_type}")
-        
-        if shelf_name:
-            alerts = [alert for alert in alerts if alert.shelf_name == shelf_name]
-        
-        # Apply limit
-        alerts = alerts[:limit]
-        
-        return {
+
+        # Coerce filters to enums before hitting the database
+        priority_enum = _priority_filter(priority) if priority else None
+        if priority and priority_enum is None:
+            raise HTTPException(status_code=400, detail=f"Invalid priority: {priority}")
+
+        type_enum = _type_filter(alert_type) if alert_type else None
+        if alert_type and type_enum is None:
+            raise HTTPException(status_code=400, detail=f"Invalid alert type: {alert_type}")
+
+        # All filtering and limiting happens in SQL
+        alerts = alert_service.get_active_alerts_filtered(
+            employee_id=employee_id,
+            priority=priority_enum,
+            alert_type=type_enum,
+            shelf_name=shelf_name,
+            limit=limit
+        )
+
+        return ORJSONResponse({
             "success": True,
             "alerts": [alert.to_dict() for alert in alerts],
             "count": len(alerts),
-            "total_active": len(alert_service.get_active_alerts())
-        }
+            "total_active": alert_service.count_active_alerts()
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching active alerts: {str(e)}")
+        logger.exception("Error fetching active alerts")
         raise HTTPException(status_code=500, detail=f"Error fetching alerts: {str(e)}")
 
 @router.get("/dashboard/{employee_id}")
@@ -142,31 +199,27 @@ async def get_dashboard_alerts(
     """Get alerts for specific employee dashboard"""
     
     try:
-        # Validate employee exists
-        employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-        if not employee:
+        # Validate employee exists (cached)
+        employee_info = _get_employee_info(db, employee_id)
+        if not employee_info:
             raise HTTPException(status_code=404, detail="Employee not found")
         
         alert_service = AlertService(db)
         alerts = alert_service.get_active_alerts(employee_id)
         statistics = alert_service.get_alert_statistics()
         
-        return {
+        return ORJSONResponse({
             "success": True,
-            "employee": {
-                "employee_id": employee.employee_id,
-                "username": employee.username,
-                "role": employee.role
-            },
+            "employee": employee_info,
             "alerts": [alert.to_dict() for alert in alerts],
             "statistics": statistics,
             "count": len(alerts)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching dashboard alerts for {employee_id}: {str(e)}")
+        logger.exception("Error fetching dashboard alerts for %s", employee_id)
         raise HTTPException(status_code=500, detail=f"Error fetching dashboard alerts: {str(e)}")
 
 @router.post("/acknowledge/{alert_id}")
@@ -178,9 +231,8 @@ async def acknowledge_alert(
     """Acknowledge an alert"""
     
     try:
-        # Validate employee exists
-        employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-        if not employee:
+        # Validate employee exists (cached)
+        if not _get_employee_info(db, employee_id):
             raise HTTPException(status_code=404, detail="Employee not found")
         
         alert_service = AlertService(db)
@@ -197,7 +249,7 @@ async def acknowledge_alert(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error acknowledging alert {alert_id}: {str(e)}")
+        logger.exception("Error acknowledging alert %s", alert_id)
         raise HTTPException(status_code=500, detail=f"Error acknowledging alert: {str(e)}")
 
 @router.post("/resolve/{alert_id}")
@@ -209,9 +261,8 @@ async def resolve_alert(
     """Resolve an alert"""
     
     try:
-        # Validate employee exists
-        employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-        if not employee:
+        # Validate employee exists (cached)
+        if not _get_employee_info(db, employee_id):
             raise HTTPException(status_code=404, detail="Employee not found")
         
         alert_service = AlertService(db)
@@ -228,7 +279,7 @@ async def resolve_alert(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error resolving alert {alert_id}: {str(e)}")
+        logger.exception("Error resolving alert %s", alert_id)
         raise HTTPException(status_code=500, detail=f"Error resolving alert: {str(e)}")
 
 @router.get("/history/{alert_id}")
@@ -259,17 +310,17 @@ async def get_alert_history(
                 "timestamp": record.timestamp.isoformat() if record.timestamp else None
             })
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "alert": alert.to_dict(),
             "history": history_data,
             "count": len(history_data)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching alert history for {alert_id}: {str(e)}")
+        logger.exception("Error fetching alert history for %s", alert_id)
         raise HTTPException(status_code=500, detail=f"Error fetching alert history: {str(e)}")
 
 @router.get("/statistics")
@@ -280,18 +331,9 @@ async def get_alert_statistics(
     
     try:
         alert_service = AlertService(db)
-        statistics = alert_service.get_alert_statistics()
         
-        # Add additional statistics
-        total_alerts = db.query(Alert).count()
-        resolved_alerts = db.query(Alert).filter(Alert.status == AlertStatus.RESOLVED).count()
-        acknowledged_alerts = db.query(Alert).filter(Alert.status == AlertStatus.ACKNOWLEDGED).count()
-        
-        statistics.update({
-            "total_alerts": total_alerts,
-            "resolved_alerts": resolved_alerts,
-            "acknowledged_alerts": acknowledged_alerts
-        })
+        # One grouped query covers totals and per-status counts (cached briefly)
+        statistics = alert_service.get_alert_statistics()
         
         return {
             "success": True,
@@ -299,7 +341,7 @@ async def get_alert_statistics(
         }
         
     except Exception as e:
-        logger.error(f"Error fetching alert statistics: {str(e)}")
+        logger.exception("Error fetching alert statistics")
         raise HTTPException(status_code=500, detail=f"Error fetching statistics: {str(e)}")
 
 @router.get("/")
@@ -316,56 +358,64 @@ async def get_all_alerts(
     """Get all alerts with filtering and pagination"""
     
     try:
-        # Build query
-        query = db.query(Alert)
-        
-        # Apply filters
+        # Build filter list once; reused for the page query and the count
+        filters = []
         if status:
-            try:
-                status_enum = AlertStatus(status.upper())
-                query = query.filter(Alert.status == status_enum)
-            except ValueError:
+            status_enum = _status_filter(status)
+            if status_enum is None:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+            filters.append(Alert.status == status_enum)
         
         if priority:
-            try:
-                priority_enum = AlertPriority(priority.upper())
-                query = query.filter(Alert.priority == priority_enum)
-            except ValueError:
+            priority_enum = _priority_filter(priority)
+            if priority_enum is None:
                 raise HTTPException(status_code=400, detail=f"Invalid priority: {priority}")
+            filters.append(Alert.priority == priority_enum)
         
         if alert_type:
-            try:
-                type_enum = AlertType(alert_type.upper())
-                query = query.filter(Alert.alert_type == type_enum)
-            except ValueError:
+            type_enum = _type_filter(alert_type)
+            if type_enum is None:
                 raise HTTPException(status_code=400, detail=f"Invalid alert type: {alert_type}")
+            filters.append(Alert.alert_type == type_enum)
         
         if shelf_name:
-            query = query.filter(Alert.shelf_name == shelf_name)
+            filters.append(Alert.shelf_name == shelf_name)
         
         if employee_id:
-            query = query.filter(Alert.assigned_staff_id == employee_id)
-        
-        # Get total count before pagination
-        total_count = query.count()
-        
-        # Apply pagination and ordering
-        alerts = query.order_by(Alert.created_at.desc()).offset(offset).limit(limit).all()
-        
-        return {
+            filters.append(Alert.assigned_staff_id == employee_id)
+        
+        # Fetch the page and the total in one execution via a window count
+        rows = db.execute(
+            select(*_ALERT_COLUMNS, func.count().over().label("_total"))
+            .where(*filters)
+            .order_by(Alert.created_at.desc()).offset(offset).limit(limit)
+        ).mappings().all()
+
+        if rows:
+            total_count = rows[0]["_total"]
+        elif offset > 0:
+            # A page past the end has no rows to carry the window count;
+            # fall back to a plain count so clients still see the real total
+            total_count = db.execute(
+                select(func.count()).select_from(Alert).where(*filters)
+            ).scalar()
+        else:
+            total_count = 0
+        alerts = [{k: v for k, v in row.items() if k != "_total"} for row in rows]
+        
+        return ORJSONResponse({
             "success": True,
-            "alerts": [alert.to_dict() for alert in alerts],
+            "alerts": alerts,
             "count": len(alerts),
             "total_count": total_count,
             "offset": offset,
             "limit": limit
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching alerts: {str(e)}")
+        logger.exception("Error fetching alerts")
         raise HTTPException(status_code=500, detail=f"Error fetching alerts: {str(e)}")
 
 @router.get("/{alert_id}")
@@ -376,21 +426,21 @@ async def get_alert_details(
     """Get detailed information about a specific alert"""
     
     try:
-        alert = db.query(Alert).filter(Alert.id == alert_id).first()
+        # Eager-load the assigned employee so the detail view is one less round-trip
+        alert = db.query(Alert).options(
+            joinedload(Alert.assigned_staff)
+        ).filter(Alert.id == alert_id).first()
         if not alert:
             raise HTTPException(status_code=404, detail="Alert not found")
-        
-        # Get assigned employee info if available
+
         assigned_employee = None
-        if alert.assigned_staff_id:
-            employee = db.query(Employee).filter(Employee.employee_id == alert.assigned_staff_id).first()
-            if employee:
-                assigned_employee = {
-                    "employee_id": employee.employee_id,
-                    "username": employee.username,
-                    "role": employee.role
-                }
-        
+        if alert.assigned_staff:
+            assigned_employee = {
+                "employee_id": alert.assigned_staff.employee_id,
+                "username": alert.assigned_staff.username,
+                "role": alert.assigned_staff.role
+            }
+
         # Get recent history (last 5 actions)
         recent_history = db.query(AlertHistory).filter(
             AlertHistory.alert_id == alert_id
@@ -405,19 +455,20 @@ async def get_alert_details(
                 "timestamp": record.timestamp.isoformat() if record.timestamp else None
             })
         
-        alert_data = alert.to_dict()
+        # Copy so the extra keys don't leak into the cached dict on the model
+        alert_data = dict(alert.to_dict())
         alert_data["assigned_employee"] = assigned_employee
         alert_data["recent_history"] = history_data
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "alert": alert_data
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching alert details for {alert_id}: {str(e)}")
+        logger.exception("Error fetching alert details for %s", alert_id)
         raise HTTPException(status_code=500, detail=f"Error fetching alert details: {str(e)}")
 
 @router.post("/bulk-acknowledge")
@@ -429,33 +480,22 @@ async def bulk_acknowledge_alerts(
     """Acknowledge multiple alerts at once"""
     
     try:
-        # Validate employee exists
-        employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-        if not employee:
+        # Validate employee exists (cached)
+        if not _get_employee_info(db, employee_id):
             raise HTTPException(status_code=404, detail="Employee not found")
         
         if not alert_ids:
             raise HTTPException(status_code=400, detail="No alert IDs provided")
         
         alert_service = AlertService(db)
-        successful_count = 0
-        failed_alerts = []
-        
-        for alert_id in alert_ids:
-            try:
-                success = alert_service.acknowledge_alert(alert_id, employee_id)
-                if success:
-                    successful_count += 1
-                else:
-                    failed_alerts.append(alert_id)
-            except Exception as e:
-                logger.error(f"Error acknowledging alert {alert_id}: {str(e)}")
-                failed_alerts.append(alert_id)
-        
+
+        # Single UPDATE + bulk history insert instead of per-alert round-trips
+        updated_ids, failed_alerts = alert_service.bulk_acknowledge(alert_ids, employee_id)
+
         return {
             "success": True,
-            "message": f"Successfully acknowledged {successful_count} alerts",
-            "successful_count": successful_count,
+            "message": f"Successfully acknowledged {len(updated_ids)} alerts",
+            "successful_count": len(updated_ids),
             "failed_alerts": failed_alerts,
             "total_requested": len(alert_ids)
         }
@@ -463,7 +503,7 @@ async def bulk_acknowledge_alerts(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in bulk acknowledge: {str(e)}")
+        logger.exception("Error in bulk acknowledge")
         raise HTTPException(status_code=500, detail=f"Error in bulk acknowledge: {str(e)}")
 
 @router.post("/bulk-resolve")
@@ -475,33 +515,22 @@ async def bulk_resolve_alerts(
     """Resolve multiple alerts at once"""
     
     try:
-        # Validate employee exists
-        employee = db.query(Employee).filter(Employee.employee_id == employee_id).first()
-        if not employee:
+        # Validate employee exists (cached)
+        if not _get_employee_info(db, employee_id):
             raise HTTPException(status_code=404, detail="Employee not found")
         
         if not alert_ids:
             raise HTTPException(status_code=400, detail="No alert IDs provided")
         
         alert_service = AlertService(db)
-        successful_count = 0
-        failed_alerts = []
-        
-        for alert_id in alert_ids:
-            try:
-                success = alert_service.resolve_alert(alert_id, employee_id)
-                if success:
-                    successful_count += 1
-                else:
-                    failed_alerts.append(alert_id)
-            except Exception as e:
-                logger.error(f"Error resolving alert {alert_id}: {str(e)}")
-                failed_alerts.append(alert_id)
-        
+
+        # Single UPDATE + bulk history insert instead of per-alert round-trips
+        updated_ids, failed_alerts = alert_service.bulk_resolve(alert_ids, employee_id)
+
         return {
             "success": True,
-            "message": f"Successfully resolved {successful_count} alerts",
-            "successful_count": successful_count,
+            "message": f"Successfully resolved {len(updated_ids)} alerts",
+            "successful_count": len(updated_ids),
             "failed_alerts": failed_alerts,
             "total_requested": len(alert_ids)
         }
@@ -509,7 +538,7 @@ async def bulk_resolve_alerts(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in bulk resolve: {str(e)}")
+        logger.exception("Error in bulk resolve")
         raise HTTPException(status_code=500, detail=f"Error in bulk resolve: {str(e)}")
 
 @router.get("/shelf/{shelf_name}")
@@ -521,26 +550,28 @@ async def get_shelf_alerts(
     """Get all alerts for a specific shelf"""
     
     try:
-        query = db.query(Alert).filter(Alert.shelf_name == shelf_name)
+        filters = [Alert.shelf_name == shelf_name]
         
         if status:
-            try:
-                status_enum = AlertStatus(status.upper())
-                query = query.filter(Alert.status == status_enum)
-            except ValueError:
+            status_enum = _status_filter(status)
+            if status_enum is None:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+            filters.append(Alert.status == status_enum)
         
-        alerts = query.order_by(Alert.created_at.desc()).all()
+        rows = db.execute(
+            select(*_ALERT_COLUMNS).where(*filters).order_by(Alert.created_at.desc())
+        ).mappings().all()
+        alerts = [dict(row) for row in rows]
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "shelf_name": shelf_name,
-            "alerts": [alert.to_dict() for alert in alerts],
+            "alerts": alerts,
             "count": len(alerts)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching shelf alerts for {shelf_name}: {str(e)}")
+        logger.exception("Error fetching shelf alerts for %s", shelf_name)
         raise HTTPException(status_code=500, detail=f"Error fetching shelf alerts: {str(e)}")
\ No newline at end of file
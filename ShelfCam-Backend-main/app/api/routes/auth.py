@@ -1,21 +1,43 @@
+import hmac
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.schemas.user import LoginRequest, TokenResponse
 from app.models.employee import Employee
 from app.core.jwt_token import create_access_token
 from app.database.db import get_db
+from app.services.auth_service import hash_password, verify_password
 
 router = APIRouter(tags=["Authentication"])
 
+
+def _check_password(plain: str, stored: str) -> bool:
+    """Verify a password against the stored value.
+
+    New rows hold bcrypt hashes; legacy rows may still be plaintext, so those
+    fall back to a constant-time compare until rehashed on next login.
+    """
+    if not stored:
+        return False
+    if stored.startswith("$2"):
+        return verify_password(plain, stored)
+    # Compare as bytes: compare_digest rejects non-ASCII str inputs
+    return hmac.compare_digest(stored.encode(), plain.encode())
+
+
 @router.post("/auth/login", response_model=TokenResponse)
-def login_user(data: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(Employee).filter(
-        Employee.employee_id == data.employee_id,
-        Employee.username == data.username,
-        Employee.role == data.role
-    ).first()
-
-    if not user or user.password != data.password:
+async def login_user(data: LoginRequest, db: Session = Depends(get_db)):
+    # Blocking DB query and bcrypt work run off the event loop
+    user = await run_in_threadpool(
+        lambda: db.query(Employee).filter(
+            Employee.employee_id == data.employee_id,
+            Employee.username == data.username,
+            Employee.role == data.role
+        ).first()
+    )
+
+    if not user or not await run_in_threadpool(_check_password, data.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials. Please check employee ID, username, password, or role."
@@ -27,6 +49,11 @@ def login_user(data: LoginRequest, db: Session = Depends(get_db)):
             detail="Account is inactive. Contact admin."
         )
 
+    # Upgrade legacy plaintext rows to bcrypt on successful login
+    if not user.password.startswith("$2"):
+        user.password = await run_in_threadpool(hash_password, data.password)
+        db.commit()
+
     token = create_access_token({
         "sub": user.employee_id,
         "role": user.role
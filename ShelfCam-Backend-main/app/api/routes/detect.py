@@ -1,20 +1,20 @@
 # app/api/routes/detect.py
+import asyncio
+
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pathlib import Path
-import shutil
-import json
 import logging
 
 from app.database.db import get_db
-from app.services.model_runner import run_model_on_image
+from app.services.model_runner import get_model_pool, infer_image
 from app.services.alert_service import AlertService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = Path("static/uploads")
-OUTPUT_JSON = Path("static/outputs/output.json")
 
 @router.post("/detect/")
 async def detect_and_alert(
@@ -25,19 +25,21 @@ async def detect_and_alert(
     try:
         UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
         upload_path = UPLOAD_DIR / file.filename
-        with open(upload_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
 
-        success = run_model_on_image(str(upload_path), shelf_number)
-        if not success:
+        # Stream the upload off the event loop so other requests keep moving
+        with open(upload_path, "wb") as buffer:
+            while chunk := await file.read(65536):
+                await run_in_threadpool(buffer.write, chunk)
+
+        # Inference runs in a persistent worker process; the result comes back
+        # over IPC instead of a round-trip through output.json on disk
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(
+            get_model_pool(), infer_image, str(upload_path), shelf_number
+        )
+        if not data:
             raise HTTPException(status_code=500, detail="Model failed")
 
-        if not OUTPUT_JSON.exists():
-            raise HTTPException(status_code=500, detail="output.json not found")
-
-        with open(OUTPUT_JSON, "r") as f:
-            data = json.load(f)
-
         alert_service = AlertService(db)
         result = alert_service.process_json_data(data)
 
@@ -3,55 +3,78 @@ from sqlalchemy.orm import Session
 from typing import List
 from app.database.db import get_db
 from app.models.inventory import Inventory
-from app.models.employee import Employee
 from app.models.shelf import Shelf
 from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse, CategoryEnum, ShelfSlotsResponse
-from app.deps.roles import require_store_manager
+from app.core.responses import ORJSONResponse
+from app.deps.roles import TokenUser, require_store_manager_light
+from sqlalchemy import select, func, exists, update
 from sqlalchemy.exc import IntegrityError
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
+
+def _is_rack_conflict(error: IntegrityError) -> bool:
+    """True when the unique violation came from ux_inventory_shelf_rack"""
+    constraint = getattr(getattr(error.orig, 'diag', None), 'constraint_name', None)
+    if constraint:
+        return constraint == 'ux_inventory_shelf_rack'
+    return 'ux_inventory_shelf_rack' in str(error.orig)
+
+# Category dropdown values never change at runtime; build the list once
+_CATEGORY_VALUES = tuple(category.value for category in CategoryEnum)
+
 @router.post("/", response_model=InventoryResponse, status_code=status.HTTP_201_CREATED)
 def create_inventory_item(
     inventory_data: InventoryCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new inventory item (Store Manager only)"""
-    
-    # Check if shelf exists and is active
-    shelf = db.query(Shelf).filter(Shelf.name == inventory_data.shelf_name).first()
-    if not shelf:
+
+    # One round-trip covers all pre-checks: shelf existence/activity,
+    # current item count, and rack occupancy
+    item_count = (
+        select(func.count())
+        .where(Inventory.shelf_name == inventory_data.shelf_name)
+        .scalar_subquery()
+    )
+    rack_taken = (
+        exists()
+        .where(
+            Inventory.shelf_name == inventory_data.shelf_name,
+            Inventory.rack_name == inventory_data.rack_name
+        )
+    )
+    row = db.execute(
+        select(Shelf.capacity, Shelf.is_active, item_count, rack_taken)
+        .where(Shelf.name == inventory_data.shelf_name)
+    ).first()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shelf not found"
         )
-    
-    if not shelf.is_active:
+
+    capacity, is_active, current_items, rack_occupied = row
+
+    if not is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot add items to inactive shelf"
         )
-    
-    # Check if shelf has capacity
-    current_items = db.query(Inventory).filter(Inventory.shelf_name == inventory_data.shelf_name).count()
-    if current_items >= shelf.capacity:
+
+    if current_items >= capacity:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Shelf capacity exceeded. Maximum capacity: {shelf.capacity}"
+            detail=f"Shelf capacity exceeded. Maximum capacity: {capacity}"
         )
-    
-    # Check if rack is already occupied on this shelf
-    existing_rack = db.query(Inventory).filter(
-        Inventory.shelf_name == inventory_data.shelf_name,
-        Inventory.rack_name == inventory_data.rack_name
-    ).first()
-    
-    if existing_rack:
+
+    if rack_occupied:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Rack '{inventory_data.rack_name}' is already occupied on shelf '{inventory_data.shelf_name}'"
         )
-    
+
     try:
         db_inventory = Inventory(
             shelf_name=inventory_data.shelf_name,
@@ -64,26 +87,40 @@ def create_inventory_item(
         db.commit()
         db.refresh(db_inventory)
         return db_inventory
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if _is_rack_conflict(e):
+            # A concurrent insert can win the rack between pre-check and commit
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Rack '{inventory_data.rack_name}' is already occupied on shelf '{inventory_data.shelf_name}'"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Product number already exists"
         )
 
-@router.get("/", response_model=List[InventoryResponse])
+@router.get("/", response_model=None)
 def get_all_inventory(
     db: Session = Depends(get_db)
 ):
     """Get all inventory items"""
-    inventory_items = db.query(Inventory).all()
-    return {"inventory": inventory_items}
+    # The declared List[...] model never matched the {"inventory": ...} body;
+    # serve plain column rows straight through orjson instead
+    rows = db.execute(
+        select(
+            Inventory.id, Inventory.shelf_name, Inventory.product_number,
+            Inventory.product_name, Inventory.category, Inventory.rack_name,
+            Inventory.created_at, Inventory.updated_at
+        )
+    ).mappings().all()
+    return ORJSONResponse({"inventory": [dict(row) for row in rows]})
 
 @router.get("/{product_number}", response_model=InventoryResponse)
 def get_inventory_item(
     product_number: str,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Get specific inventory item by product number (Store Manager only)"""
     inventory_item = db.query(Inventory).filter(Inventory.product_number == product_number).first()
@@ -98,7 +135,7 @@ def get_inventory_item(
 def get_shelf_slots(
     shelf_name: str,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Get available slots for a specific shelf (Store Manager only)"""
     
@@ -110,15 +147,18 @@ def get_shelf_slots(
             detail="Shelf not found"
         )
     
-    # Get occupied racks
-    occupied_items = db.query(Inventory).filter(Inventory.shelf_name == shelf_name).all()
-    occupied_racks = [item.rack_name for item in occupied_items]
-    
+    # Aggregate occupancy server-side instead of materializing inventory rows
+    occupied_slots, occupied_racks = db.execute(
+        select(func.count(), func.array_agg(Inventory.rack_name))
+        .where(Inventory.shelf_name == shelf_name)
+    ).one()
+    occupied_racks = occupied_racks or []
+
     return ShelfSlotsResponse(
         shelf_name=shelf_name,
         capacity=shelf.capacity,
-        occupied_slots=len(occupied_racks),
-        available_slots=shelf.capacity - len(occupied_racks),
+        occupied_slots=occupied_slots,
+        available_slots=shelf.capacity - occupied_slots,
         occupied_racks=occupied_racks
     )
 
@@ -127,72 +167,95 @@ def update_inventory_item(
     product_number: str,
     inventory_data: InventoryUpdate,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Update inventory item (Store Manager only)"""
-    inventory_item = db.query(Inventory).filter(Inventory.product_number == product_number).first()
-    if not inventory_item:
+    # Light projection instead of full-row hydration; only placement fields
+    # matter for the pre-checks
+    current = db.execute(
+        select(Inventory.id, Inventory.shelf_name, Inventory.rack_name)
+        .where(Inventory.product_number == product_number)
+    ).first()
+    if not current:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Inventory item not found"
         )
-    
+
     update_data = inventory_data.model_dump(exclude_unset=True)
-    
-    # If updating shelf_name, check if new shelf exists and is active
-    if 'shelf_name' in update_data:
-        shelf = db.query(Shelf).filter(Shelf.name == update_data['shelf_name']).first()
-        if not shelf:
+
+    # If the item is moving, run one combined shelf/capacity/rack check
+    if 'shelf_name' in update_data or 'rack_name' in update_data:
+        target_shelf = update_data.get('shelf_name', current.shelf_name)
+        target_rack = update_data.get('rack_name', current.rack_name)
+
+        item_count = (
+            select(func.count())
+            .where(Inventory.shelf_name == target_shelf)
+            .scalar_subquery()
+        )
+        rack_taken = (
+            exists()
+            .where(
+                Inventory.shelf_name == target_shelf,
+                Inventory.rack_name == target_rack,
+                Inventory.id != current.id
+            )
+        )
+        row = db.execute(
+            select(Shelf.capacity, Shelf.is_active, item_count, rack_taken)
+            .where(Shelf.name == target_shelf)
+        ).first()
+
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Shelf not found"
             )
-        if not shelf.is_active:
+
+        capacity, is_active, current_items, rack_occupied = row
+
+        if 'shelf_name' in update_data and not is_active:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot move item to inactive shelf"
             )
-    
-    # If updating shelf_name or rack_name, check for conflicts
-    if 'shelf_name' in update_data or 'rack_name' in update_data:
-        target_shelf = update_data.get('shelf_name', inventory_item.shelf_name)
-        target_rack = update_data.get('rack_name', inventory_item.rack_name)
-        
-        # Check if rack is already occupied (excluding current item)
-        existing_rack = db.query(Inventory).filter(
-            Inventory.shelf_name == target_shelf,
-            Inventory.rack_name == target_rack,
-            Inventory.id != inventory_item.id
-        ).first()
-        
-        if existing_rack:
+
+        if rack_occupied:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Rack '{target_rack}' is already occupied on shelf '{target_shelf}'"
             )
-        
-        # If moving to different shelf, check capacity
-        if target_shelf != inventory_item.shelf_name:
-            shelf = db.query(Shelf).filter(Shelf.name == target_shelf).first()
-            current_items = db.query(Inventory).filter(Inventory.shelf_name == target_shelf).count()
-            if current_items >= shelf.capacity:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Target shelf capacity exceeded. Maximum capacity: {shelf.capacity}"
-                )
-    
+
+        if target_shelf != current.shelf_name and current_items >= capacity:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Target shelf capacity exceeded. Maximum capacity: {capacity}"
+            )
+
     try:
         if 'category' in update_data:
             update_data['category'] = update_data['category'].value
-        
-        for field, value in update_data.items():
-            setattr(inventory_item, field, value)
-        
-        db.commit()
-        db.refresh(inventory_item)
+
+        if update_data:
+            # Single UPDATE ... RETURNING; no fetch/refresh round-trips
+            inventory_item = db.execute(
+                update(Inventory)
+                .where(Inventory.product_number == product_number)
+                .values(**update_data)
+                .returning(Inventory)
+            ).scalars().first()
+            db.commit()
+        else:
+            inventory_item = db.query(Inventory).filter(Inventory.product_number == product_number).first()
         return inventory_item
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if _is_rack_conflict(e):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Target rack is already occupied on that shelf"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Product number already exists"
@@ -216,7 +279,7 @@ def delete_inventory_item(
 
 @router.get("/categories/list", response_model=List[str])
 def get_categories(
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Get all available product categories (Store Manager only)"""
-    return [category.value for category in CategoryEnum]
\ No newline at end of file
+    return _CATEGORY_VALUES
\ No newline at end of file
@@ -1,16 +1,15 @@
 from fastapi import APIRouter, Depends
-from app.deps.roles import get_current_user_role
+from app.deps.roles import require_admin, require_store_manager
+from app.models.employee import Employee
 
 router = APIRouter()
 
+# Role checks run in the dependencies, so a 403 never enters the handler body
+
 @router.get("/manager-only")
-def manager_action(role: str = Depends(get_current_user_role)):
-    if role != "manager":
-        raise HTTPException(status_code=403, detail="Only managers allowed")
+def manager_action(current_user: Employee = Depends(require_store_manager)):
     return {"message": "Manager access granted"}
 
 @router.get("/admin-only")
-def admin_action(role: str = Depends(get_current_user_role)):
-    if role != "admin":
-        raise HTTPException(status_code=403, detail="Only admins allowed")
+def admin_action(current_user: Employee = Depends(require_admin)):
     return {"message": "Admin access granted"}
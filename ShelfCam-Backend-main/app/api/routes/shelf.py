@@ -3,14 +3,20 @@ from sqlalchemy.orm import Session
 from typing import List
 from app.database.db import get_db
 from app.models.shelf import Shelf, ShelfCategoryEnum
-from app.models.employee import Employee
 from app.schemas.shelf import ShelfCreate, ShelfUpdate, ShelfResponse
-from app.deps.roles import require_store_manager
+from sqlalchemy import select
+from app.cache.dashboard_cache import invalidate_dashboard
+from app.cache.shelf_cache import invalidate_shelf
+from app.core.responses import ORJSONResponse
+from app.deps.roles import TokenUser, require_store_manager_light
 from sqlalchemy.exc import IntegrityError
 from app.models.staff_assignment import StaffAssignment
 
 router = APIRouter(prefix="/shelves", tags=["shelf-management"])
 
+# Category dropdown values never change at runtime; build the list once
+_SHELF_CATEGORY_VALUES = tuple(category.value for category in ShelfCategoryEnum)
+
 @router.post("/", response_model=ShelfResponse, status_code=status.HTTP_201_CREATED)
 def create_shelf(
     shelf_data: ShelfCreate,
@@ -28,6 +34,8 @@ def create_shelf(
         db.add(db_shelf)
         db.commit()
         db.refresh(db_shelf)
+        invalidate_shelf(db_shelf.name)
+        invalidate_dashboard()
         return db_shelf
     except IntegrityError:
         db.rollback()
@@ -42,11 +50,15 @@ def get_all_shelves(
     db: Session = Depends(get_db)
 ):
     """Get all shelves (accessible to all authenticated users)"""
-    query = db.query(Shelf)
+    # Column rows instead of ORM instances for the read-only listing
+    stmt = select(
+        Shelf.id, Shelf.name, Shelf.category, Shelf.capacity, Shelf.description,
+        Shelf.is_active, Shelf.current_stock, Shelf.created_at, Shelf.updated_at
+    )
     if not include_inactive:
-        query = query.filter(Shelf.is_active == True)
-    shelves = query.all()
-    return {"shelves": shelves}
+        stmt = stmt.where(Shelf.is_active == True)
+    rows = db.execute(stmt).mappings().all()
+    return ORJSONResponse({"shelves": [dict(row) for row in rows]})
 
 @router.get("/{shelf_name}", response_model=ShelfResponse)
 def get_shelf_by_name(
@@ -82,6 +94,9 @@ def update_shelf(
             setattr(shelf, field, value)
         db.commit()
         db.refresh(shelf)
+        invalidate_shelf(shelf_name)
+        invalidate_shelf(shelf.name)
+        invalidate_dashboard()
         return shelf
     except IntegrityError:
         db.rollback()
@@ -94,7 +109,7 @@ def update_shelf(
 def delete_shelf(
     shelf_name: str,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Delete shelf (Store Manager only)"""
     shelf = db.query(Shelf).filter(Shelf.name == shelf_name).first()
@@ -104,32 +119,37 @@ def delete_shelf(
             detail="Shelf not found"
         )
 
-    active_assignments = db.query(StaffAssignment).filter(
-        StaffAssignment.shelf_id == shelf.name,
-        StaffAssignment.is_active == True
-    ).count()
+    # EXISTS stops at the first matching row instead of counting them all
+    has_active_assignments = db.query(
+        db.query(StaffAssignment).filter(
+            StaffAssignment.shelf_id == shelf.name,
+            StaffAssignment.is_active == True
+        ).exists()
+    ).scalar()
 
-    if active_assignments > 0:
+    if has_active_assignments:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot delete shelf with {active_assignments} active staff assignments"
+            detail="Cannot delete shelf with active staff assignments"
         )
 
     db.delete(shelf)
     db.commit()
+    invalidate_shelf(shelf_name)
+    invalidate_dashboard()
 
 @router.get("/categories/list", response_model=List[str])
 def get_shelf_categories(
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Get all available shelf categories (Store Manager only)"""
-    return [category.value for category in ShelfCategoryEnum]
+    return _SHELF_CATEGORY_VALUES
 
 @router.patch("/{shelf_name}/toggle-status", response_model=ShelfResponse)
 def toggle_shelf_status(
     shelf_name: str,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
     """Toggle shelf active/inactive status (Store Manager only)"""
     shelf = db.query(Shelf).filter(Shelf.name == shelf_name).first()
@@ -140,18 +160,22 @@ def toggle_shelf_status(
         )
 
     if shelf.is_active:
-        active_assignments = db.query(StaffAssignment).filter(
-            StaffAssignment.shelf_id == shelf.name,
-            StaffAssignment.is_active == True
-        ).count()
+        has_active_assignments = db.query(
+            db.query(StaffAssignment).filter(
+                StaffAssignment.shelf_id == shelf.name,
+                StaffAssignment.is_active == True
+            ).exists()
+        ).scalar()
 
-        if active_assignments > 0:
+        if has_active_assignments:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cannot deactivate shelf with {active_assignments} active staff assignments"
+                detail="Cannot deactivate shelf with active staff assignments"
             )
 
     shelf.is_active = not shelf.is_active
     db.commit()
     db.refresh(shelf)
+    invalidate_shelf(shelf_name)
+    invalidate_dashboard()
     return shelf
@@ -1,16 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.responses import ORJSONResponse
 from app.database.db import get_db
 from app.models.employee import Employee
 
 router = APIRouter(tags=["Staff"])
 
+# Listing endpoints read plain column rows - no ORM instances, no identity
+# map, and the password column stays out of the payload
+_EMPLOYEE_COLUMNS = (
+    Employee.id,
+    Employee.employee_id,
+    Employee.username,
+    Employee.role,
+    Employee.email,
+    Employee.phone,
+    Employee.is_active,
+)
+
 @router.get("/staff/")
 def get_all_staff(db: Session = Depends(get_db)):
     """Get all staff members"""
     try:
-        staff = db.query(Employee).all()
-        return {"staff": staff}
+        rows = db.execute(select(*_EMPLOYEE_COLUMNS)).mappings().all()
+        return ORJSONResponse({"staff": [dict(row) for row in rows]})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -18,7 +32,7 @@ def get_all_staff(db: Session = Depends(get_db)):
 def get_all_employees(db: Session = Depends(get_db)):
     """Alternative endpoint - get all employees"""
     try:
-        employees = db.query(Employee).all()
-        return {"employees": employees}
+        rows = db.execute(select(*_EMPLOYEE_COLUMNS)).mappings().all()
+        return ORJSONResponse({"employees": [dict(row) for row in rows]})
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
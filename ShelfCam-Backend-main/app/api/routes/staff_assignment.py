@@ -1,9 +1,10 @@
 # ✅ Cleaned version of staff_assignment.py with only username used for employee display
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, aliased
-from sqlalchemy import and_, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import and_, exists, select, func, text
 from typing import List, Optional
 from datetime import datetime
+from hashlib import md5
 from app.database.db import get_db
 from app.models.staff_assignment import StaffAssignment, AssignmentHistory
 from app.models.employee import Employee
@@ -13,50 +14,104 @@ from app.schemas.staff_assignment import (
     AvailableStaffResponse, AssignmentHistoryResponse, AssignmentDashboardResponse
 )
 from app.schemas.shelf import ShelfWithAssignments
-from app.deps.roles import require_store_manager
+from app.cache.dashboard_cache import get_dashboard_cached, set_dashboard_cache, invalidate_dashboard
+from app.cache.shelf_cache import get_shelf_cached
+from app.core.responses import ORJSONResponse
+from app.deps.roles import TokenUser, require_store_manager, require_store_manager_light
 
 router = APIRouter(prefix="/staff-assignments", tags=["staff-assignment"])
 
+
+def _assignments_etag(db: Session, include_shelves: bool = False) -> str:
+    """Cheap ETag from max(updated_at) + row count of the backing tables"""
+    sa_max, sa_count = db.execute(
+        select(func.max(StaffAssignment.updated_at), func.count()).select_from(StaffAssignment)
+    ).one()
+    token = f"{sa_max}-{sa_count}"
+    if include_shelves:
+        sh_max, sh_count = db.execute(
+            select(func.max(Shelf.updated_at), func.count()).select_from(Shelf)
+        ).one()
+        token += f"-{sh_max}-{sh_count}"
+    return md5(token.encode()).hexdigest()
+
+
 @router.get("/dashboard", response_model=AssignmentDashboardResponse)
-def get_assignment_dashboard(db: Session = Depends(get_db), current_user: Employee = Depends(require_store_manager)):
-    total_shelves = db.query(Shelf).count()
-    active_shelves = db.query(Shelf).filter(Shelf.is_active == True).count()
+def get_assignment_dashboard(request: Request, response: Response, db: Session = Depends(get_db), current_user: TokenUser = Depends(require_store_manager_light)):
+    # Serve from the cache with the ETag it was stored under, so validator
+    # and body can never diverge (each worker has its own cache)
+    cached = get_dashboard_cached()
+    if cached is not None:
+        dashboard, etag = cached
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return dashboard
+
+    # Polling clients mostly see unchanged data; honor If-None-Match first
+    etag = _assignments_etag(db, include_shelves=True)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # Shelf and assignment totals each collapse into one FILTERed aggregate
+    total_shelves, active_shelves = db.execute(
+        select(func.count(), func.count().filter(Shelf.is_active == True)).select_from(Shelf)
+    ).one()
     inactive_shelves = total_shelves - active_shelves
 
-    total_assignments = db.query(StaffAssignment).count()
-    active_assignments = db.query(StaffAssignment).filter(StaffAssignment.is_active == True).count()
+    total_assignments, active_assignments = db.execute(
+        select(func.count(), func.count().filter(StaffAssignment.is_active == True)).select_from(StaffAssignment)
+    ).one()
 
-    assigned_employee_ids = select(StaffAssignment.employee_id).filter(StaffAssignment.is_active == True)
+    # NOT EXISTS anti-join; NOT IN defeats the planner on nullable columns
+    has_active_assignment = exists().where(
+        and_(StaffAssignment.employee_id == Employee.employee_id, StaffAssignment.is_active == True)
+    )
 
     available_staff_count = db.query(Employee).filter(
-        and_(Employee.role == "staff", Employee.is_active == True, ~Employee.employee_id.in_(assigned_employee_ids))
+        and_(Employee.role == "staff", Employee.is_active == True, ~has_active_assignment)
     ).count()
 
-    shelves_with_assignments = []
-    shelves = db.query(Shelf).filter(Shelf.is_active == True).all()
-
-    for shelf in shelves:
-        Staff = aliased(Employee)
-        assignments = db.query(StaffAssignment).join(Staff, StaffAssignment.employee_id == Staff.employee_id).filter(
-            and_(StaffAssignment.shelf_id == shelf.name, StaffAssignment.is_active == True, Staff.is_active == True)
-        ).all()
+    # One grouped query replaces the per-shelf assignment lookup (N+1);
+    # only the columns the response needs are fetched
+    rows = db.execute(
+        select(
+            Shelf.id,
+            Shelf.name,
+            Shelf.category,
+            Shelf.is_active,
+            Shelf.capacity,
+            Shelf.created_at,
+            Shelf.updated_at,
+            func.count(Employee.employee_id).label("staff_count"),
+            func.array_agg(Employee.username).label("staff_names")
+        )
+        .select_from(Shelf)
+        .outerjoin(StaffAssignment, and_(StaffAssignment.shelf_id == Shelf.name, StaffAssignment.is_active == True))
+        .outerjoin(Employee, and_(Employee.employee_id == StaffAssignment.employee_id, Employee.is_active == True))
+        .where(Shelf.is_active == True)
+        .group_by(Shelf.id)
+    ).all()
 
-        assigned_staff_names = [assignment.employee.username for assignment in assignments]
+    shelves_with_assignments = []
+    for row in rows:
+        assigned_staff_names = [name for name in (row.staff_names or []) if name is not None]
 
         shelf_data = ShelfWithAssignments(
-            id=shelf.id,
-            name=shelf.name,
-            category=shelf.category.value if hasattr(shelf.category, 'value') else str(shelf.category),
-            is_active=shelf.is_active,
-            capacity=shelf.capacity,
-            created_at=shelf.created_at,
-            updated_at=shelf.updated_at,
-            assigned_staff_count=len(assignments),
+            id=row.id,
+            name=row.name,
+            category=row.category.value if hasattr(row.category, 'value') else str(row.category),
+            is_active=row.is_active,
+            capacity=row.capacity,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            assigned_staff_count=row.staff_count,
             assigned_staff=assigned_staff_names,
         )
         shelves_with_assignments.append(shelf_data)
 
-    return AssignmentDashboardResponse(
+    dashboard = AssignmentDashboardResponse(
         total_shelves=total_shelves,
         active_shelves=active_shelves,
         inactive_shelves=inactive_shelves,
@@ -65,13 +120,17 @@ def get_assignment_dashboard(db: Session = Depends(get_db), current_user: Employ
         available_staff_count=available_staff_count,
         shelves_with_assignments=shelves_with_assignments
     )
+    set_dashboard_cache(dashboard, etag)
+    return dashboard
 
 @router.get("/available-staff", response_model=List[AvailableStaffResponse])
-def get_available_staff(db: Session = Depends(get_db), current_user: Employee = Depends(require_store_manager)):
-    assigned_employee_ids = select(StaffAssignment.employee_id).filter(StaffAssignment.is_active == True)
+def get_available_staff(db: Session = Depends(get_db), current_user: TokenUser = Depends(require_store_manager_light)):
+    has_active_assignment = exists().where(
+        and_(StaffAssignment.employee_id == Employee.employee_id, StaffAssignment.is_active == True)
+    )
 
     available_staff = db.query(Employee).filter(
-        and_(Employee.role == "staff", Employee.is_active == True, ~Employee.employee_id.in_(assigned_employee_ids))
+        and_(Employee.role == "staff", Employee.is_active == True, ~has_active_assignment)
     ).all()
 
     return [
@@ -93,10 +152,8 @@ def assign_staff_to_shelf(assignment_data: StaffAssignmentCreate, db: Session =
     if not employee:
         raise HTTPException(status_code=404, detail="Active staff member not found")
 
-    shelf = db.query(Shelf).filter(
-        and_(Shelf.name == assignment_data.shelf_id, Shelf.is_active == True)
-    ).first()
-    if not shelf:
+    shelf = get_shelf_cached(db, assignment_data.shelf_id)
+    if not shelf or not shelf.is_active:
         raise HTTPException(status_code=404, detail="Active shelf not found")
 
     existing_assignment = db.query(StaffAssignment).filter(
@@ -111,9 +168,10 @@ def assign_staff_to_shelf(assignment_data: StaffAssignmentCreate, db: Session =
         assigned_by=current_user.employee_id,
         notes=assignment_data.notes
     )
+    # Flush for the PK, then commit assignment + history together so the
+    # write path pays a single fsync
     db.add(assignment)
-    db.commit()
-    db.refresh(assignment)
+    db.flush()
 
     history = AssignmentHistory(
         employee_id=employee.employee_id,
@@ -124,6 +182,8 @@ def assign_staff_to_shelf(assignment_data: StaffAssignmentCreate, db: Session =
     )
     db.add(history)
     db.commit()
+    db.refresh(assignment)
+    invalidate_dashboard()
 
     return StaffAssignmentResponse(
         id=assignment.id,
@@ -142,11 +202,17 @@ def assign_staff_to_shelf(assignment_data: StaffAssignmentCreate, db: Session =
         notes=assignment.notes
     )
 
-@router.get("/", response_model=List[StaffAssignmentResponse])
+@router.get("/", response_model=None)
 def get_all_assignments(
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: Employee = Depends(require_store_manager)
+    current_user: TokenUser = Depends(require_store_manager_light)
 ):
+    # Rows embed shelf name/category, so shelf changes must bump this too
+    etag = _assignments_etag(db, include_shelves=True)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     # Aliases for joining the same table twice
     Staff = aliased(Employee)
     Manager = aliased(Employee)
@@ -175,24 +241,26 @@ def get_all_assignments(
 
     rows = query.all()
 
-    return [
-        StaffAssignmentResponse(
-            id=row.id,
-            employee_id=row.employee_id,
-            shelf_id=row.shelf_id,
-            is_active=row.is_active,
-            assigned_date=row.assigned_at,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-            notes=row.notes,
-            assigned_by=row.assigned_by,
-            employee_name=row.employee_name,
-            shelf_name=row.shelf_name,
-            shelf_category=row.shelf_category.value if hasattr(row.shelf_category, 'value') else str(row.shelf_category),
-            assigned_by_name=row.assigned_by_name
-        )
+    # Plain dicts straight through orjson; the shapes come from our own
+    # join, so outbound Pydantic validation adds nothing but CPU
+    return ORJSONResponse([
+        {
+            "id": row.id,
+            "employee_id": row.employee_id,
+            "shelf_id": row.shelf_id,
+            "is_active": row.is_active,
+            "assigned_date": row.assigned_at,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "notes": row.notes,
+            "assigned_by": row.assigned_by,
+            "employee_name": row.employee_name,
+            "shelf_name": row.shelf_name,
+            "shelf_category": row.shelf_category.value if hasattr(row.shelf_category, 'value') else str(row.shelf_category),
+            "assigned_by_name": row.assigned_by_name
+        }
         for row in rows
-    ]
+    ], headers={"ETag": etag})
 
 # @router.put("/{assignment_id}", response_model=StaffAssignmentResponse)
 # def update_assignment(assignment_id: int, assignment_data: StaffAssignmentUpdate, db: Session = Depends(get_db), current_user: Employee = Depends(require_store_manager)):
@@ -233,37 +301,57 @@ def get_all_assignments(
 #     )
 
 @router.delete("/{assignment_id}", status_code=204)
-def unassign_staff(assignment_id: int, db: Session = Depends(get_db), current_user: Employee = Depends(require_store_manager)):
-    assignment = db.query(StaffAssignment).filter(StaffAssignment.id == assignment_id).first()
-    if not assignment:
+def unassign_staff(assignment_id: int, db: Session = Depends(get_db), current_user: TokenUser = Depends(require_store_manager_light)):
+    # DELETE and history INSERT travel in one statement; an empty RETURNING
+    # doubles as the existence check
+    row = db.execute(
+        text("""
+            WITH deleted AS (
+                DELETE FROM staff_assignments
+                WHERE id = :assignment_id
+                RETURNING employee_id, shelf_id
+            )
+            INSERT INTO assignment_history (employee_id, shelf_id, action, action_date, performed_by, notes)
+            SELECT employee_id, shelf_id, 'unassigned', :action_date, :performed_by, 'Assignment deleted'
+            FROM deleted
+            RETURNING employee_id
+        """),
+        {
+            "assignment_id": assignment_id,
+            "action_date": datetime.utcnow(),
+            "performed_by": current_user.employee_id
+        }
+    ).first()
+    db.commit()
+
+    if not row:
         raise HTTPException(status_code=404, detail="Assignment not found")
 
-    history = AssignmentHistory(
-        employee_id=assignment.employee_id,
-        shelf_id=assignment.shelf_id,
-        action="unassigned",
-        performed_by=current_user.employee_id,
-        notes="Assignment deleted"
-    )
-    db.add(history)
-    db.delete(assignment)
-    db.commit()
+    invalidate_dashboard()
 
 @router.post("/transfer/{assignment_id}", response_model=StaffAssignmentResponse)
-def transfer_staff_to_different_shelf(assignment_id: int, new_shelf_id: str, notes: Optional[str] = None, db: Session = Depends(get_db), current_user: Employee = Depends(require_store_manager)):
-    assignment = db.query(StaffAssignment).filter(StaffAssignment.id == assignment_id).first()
+def transfer_staff_to_different_shelf(assignment_id: int, new_shelf_id: str, notes: Optional[str] = None, db: Session = Depends(get_db), current_user: TokenUser = Depends(require_store_manager_light)):
+    # Eager-load the employee and assigning manager so the response build
+    # does not trigger lazy-load SELECTs
+    assignment = db.query(StaffAssignment).options(
+        joinedload(StaffAssignment.employee),
+        joinedload(StaffAssignment.assigned_by_manager)
+    ).filter(StaffAssignment.id == assignment_id).first()
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
 
-    new_shelf = db.query(Shelf).filter(and_(Shelf.name == new_shelf_id, Shelf.is_active == True)).first()
-    if not new_shelf:
+    new_shelf = get_shelf_cached(db, new_shelf_id)
+    if not new_shelf or not new_shelf.is_active:
         raise HTTPException(status_code=404, detail="New shelf not found or inactive")
 
+    # Capture names before commit; expire_on_commit would force reloads after
+    employee_name = assignment.employee.username
+    manager = assignment.assigned_by_manager
+    assigned_by_name = manager.username if manager else "Unknown"
+
     old_shelf_id = assignment.shelf_id
     assignment.shelf_id = new_shelf_id
     assignment.notes = notes
-    db.commit()
-    db.refresh(assignment)
 
     history = AssignmentHistory(
         employee_id=assignment.employee_id,
@@ -274,22 +362,23 @@ def transfer_staff_to_different_shelf(assignment_id: int, new_shelf_id: str, not
     )
     db.add(history)
     db.commit()
+    db.refresh(assignment)
+    invalidate_dashboard()
 
-    manager = db.query(Employee).filter(Employee.employee_id == assignment.assigned_by).first()
-
+    # new_shelf is already loaded; no need to lazy-load assignment.shelf
     return StaffAssignmentResponse(
         id=assignment.id,
         employee_id=assignment.employee_id,
-        employee_name=assignment.employee.username,
-        shelf_id=assignment.shelf.name,
-        shelf_name=assignment.shelf.name,
-        shelf_category=assignment.shelf.category.value if hasattr(assignment.shelf.category, 'value') else str(assignment.shelf.category),
+        employee_name=employee_name,
+        shelf_id=new_shelf.name,
+        shelf_name=new_shelf.name,
+        shelf_category=new_shelf.category.value if hasattr(new_shelf.category, 'value') else str(new_shelf.category),
         is_active=assignment.is_active,
         assigned_at=assignment.assigned_at,
         assigned_date=assignment.assigned_at,  # ✅ Fix 1
         created_at=assignment.created_at,      # ✅ Fix 2
         updated_at=assignment.updated_at,      # ✅ Fix 3
         assigned_by=assignment.assigned_by,
-        assigned_by_name=manager.username if manager else "Unknown",
+        assigned_by_name=assigned_by_name,
         notes=assignment.notes
     )
@@ -0,0 +1,31 @@
+# app/cache/dashboard_cache.py - short-TTL cache for the assignment dashboard
+import time
+from typing import Optional, Tuple
+
+# The dashboard is polled far more often than assignments or shelves change;
+# a few seconds of staleness is acceptable and saves the full aggregation.
+# The ETag is stored with the payload so the validator always matches the
+# representation actually served - each worker's cache is internally
+# consistent even when another worker has already seen newer data.
+_TTL = 10.0
+_cache = {"expires": 0.0, "value": None, "etag": None}
+
+
+def get_dashboard_cached() -> Optional[Tuple[object, str]]:
+    if _cache["value"] is not None and time.monotonic() < _cache["expires"]:
+        return _cache["value"], _cache["etag"]
+    return None
+
+
+def set_dashboard_cache(value, etag: str) -> None:
+    _cache["value"] = value
+    _cache["etag"] = etag
+    _cache["expires"] = time.monotonic() + _TTL
+
+
+def invalidate_dashboard() -> None:
+    """Drop the cached payload after any assignment or shelf mutation"""
+
+    _cache["value"] = None
+    _cache["etag"] = None
+    _cache["expires"] = 0.0
@@ -0,0 +1,53 @@
+# app/cache/shelf_cache.py - small TTL cache for hot Shelf lookups by name
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.shelf import Shelf
+
+# Shelf metadata is small, mostly read, and hot across inventory and
+# assignment endpoints; cache it briefly and invalidate on shelf mutations
+_TTL = 30.0
+_MAXSIZE = 1024
+_cache = {}
+
+
+@dataclass(frozen=True, slots=True)
+class ShelfDTO:
+    id: int
+    name: str
+    category: str
+    capacity: int
+    is_active: bool
+
+
+def get_shelf_cached(db: Session, name: str) -> Optional[ShelfDTO]:
+    """Return shelf metadata by name, served from the cache when fresh"""
+
+    entry = _cache.get(name)
+    if entry and time.monotonic() - entry[0] < _TTL:
+        return entry[1]
+
+    shelf = db.query(Shelf).filter(Shelf.name == name).first()
+    if not shelf:
+        return None
+
+    dto = ShelfDTO(
+        id=shelf.id,
+        name=shelf.name,
+        category=shelf.category.value if hasattr(shelf.category, 'value') else str(shelf.category),
+        capacity=shelf.capacity,
+        is_active=shelf.is_active,
+    )
+    if len(_cache) >= _MAXSIZE:
+        _cache.clear()
+    _cache[name] = (time.monotonic(), dto)
+    return dto
+
+
+def invalidate_shelf(name: str) -> None:
+    """Drop a shelf from the cache after a mutation"""
+
+    _cache.pop(name, None)
@@ -1,56 +1,63 @@
 # check_employee_table.py - Check what's actually in your database
 
 import os
+from functools import lru_cache
+
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Row
+from sqlalchemy.exc import ProgrammingError
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """One engine per process, however often check_employees is called"""
+    return create_engine(os.getenv("DATABASE_URL"))
+
+
 def check_employees():
     """Check employees in database"""
-    
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
+
+    if not os.getenv("DATABASE_URL"):
         print("❌ DATABASE_URL not found in .env file")
         return
-    
-    engine = create_engine(DATABASE_URL)
-    
+
+    engine = get_engine()
+
     try:
-        with engine.connect() as conn:
-            # Check if employees table exists
-            result = conn.execute(text("""
-                SELECT table_name FROM information_schema.tables 
-                WHERE table_name = 'employees'
-            """))
-            
-            if not result.fetchone():
-                print("❌ 'employees' table doesn't exist!")
-                print("🔧 You need to create the employees table first")
-                return
-            
-            print("✅ Employees table exists")
-            
-            # Get all employees
-            result = conn.execute(text("SELECT * FROM employees"))
-            employees = result.mappings().all()  # returns dict-like rows
-
-            
-            if not employees:
-                print("❌ No employees found in database!")
-                print("🔧 You need to insert employee data")
-                return
-            
-            print(f"📊 Found {len(employees)} employees:")
-            print("-" * 60)
-            for emp in employees:
+        # begin() keeps autocommit from leaving a transaction open on failure;
+        # a missing table surfaces from the query itself, no catalog probe
+        with engine.begin() as conn:
+            # Stream just the printed columns instead of buffering SELECT *
+            result = conn.execution_options(stream_results=True).execute(
+                text("SELECT employee_id, username, role FROM employees")
+            )
+
+            count = 0
+            for emp in result.mappings().yield_per(500):
+                if count == 0:
+                    print("-" * 60)
+                count += 1
                 print(f"Employee ID: {emp['employee_id']}")
                 print(f"Username: {emp['username']}")
                 print(f"Role: {emp['role']}")
 
+            if not count:
+                print("❌ No employees found in database!")
+                print("🔧 You need to insert employee data")
+                return
+
+            print(f"📊 Found {count} employees")
+
                 
+    except ProgrammingError as e:
+        if "does not exist" in str(e).lower():
+            print("❌ 'employees' table doesn't exist!")
+            print("🔧 You need to create the employees table first")
+            return
+        raise
     except Exception as e:
         print(f"❌ Database error: {e}")
 
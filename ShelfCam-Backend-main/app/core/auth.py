@@ -2,15 +2,37 @@
 from fastapi import HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
 from app.database.db import get_db
+from sqlalchemy import bindparam, select
 from app.models.employee import Employee
+from app.core.user_cache import CachedUser, get_user
 from typing import Optional
 from enum import Enum
+import sys
+
+# Compiled once at import for the numeric-id fallback lookup; projects only
+# the columns the auth path reads (and leaves the password column behind)
+_STMT_BY_ID = (
+    select(
+        Employee.id, Employee.employee_id, Employee.username,
+        Employee.role, Employee.is_active
+    )
+    .where(Employee.id == bindparam("eid"))
+    .limit(1)
+)
 
 class UserRole(str, Enum):
     AREA_MANAGER = "area_manager"
     STORE_MANAGER = "store_manager"
     STAFF = "staff"
 
+
+# Interned role strings: the guards run on every request, and the projected
+# queries return plain str, so these compare by pointer in the common case
+_AREA_MANAGER = sys.intern("area_manager")
+_STORE_MANAGER = sys.intern("store_manager")
+_STAFF = sys.intern("staff")
+_MANAGER_ROLES = frozenset((_AREA_MANAGER, _STORE_MANAGER))
+
 def get_current_user(
     employee_id: Optional[str] = Query(None, description="Employee ID"),
     db: Session = Depends(get_db)
@@ -24,10 +46,13 @@ def get_current_user(
     try:
         user = None
         if employee_id.isdigit():
-            user = db.query(Employee).filter(Employee.id == int(employee_id)).first()
+            row = db.execute(_STMT_BY_ID, {"eid": int(employee_id)}).first()
+            if row:
+                user = CachedUser(*row)
         
-        if not user and hasattr(Employee, 'employee_id'):
-            user = db.query(Employee).filter(Employee.employee_id == employee_id).first()
+        if not user:
+            # Cached snapshot; saves the per-request employees SELECT
+            user = get_user(db, employee_id)
         
         if not user:
             raise HTTPException(
@@ -35,7 +60,7 @@ def get_current_user(
                 detail=f"Employee '{employee_id}' not found"
             )
         
-        if hasattr(user, 'is_active') and not user.is_active:
+        if not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Employee account is inactive"
@@ -53,13 +78,8 @@ def get_current_user(
 
 def require_area_manager(current_user: Employee = Depends(get_current_user)):
     """🏢 AREA MANAGER ONLY - Can see active shelves and other regions/stores"""
-    if not hasattr(current_user, 'role'):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. User role not defined."
-        )
-    
-    if current_user.role != UserRole.AREA_MANAGER:
+    # The role column always exists; compare raw strings, no hasattr probe
+    if current_user.role != _AREA_MANAGER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Access denied. Area Manager role required. Your role: {current_user.role}"
@@ -69,13 +89,7 @@ def require_area_manager(current_user: Employee = Depends(get_current_user)):
 
 def require_store_manager(current_user: Employee = Depends(get_current_user)):
     """🏪 STORE MANAGER ONLY - Can access everything except other stores"""
-    if not hasattr(current_user, 'role'):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. User role not defined."
-        )
-    
-    if current_user.role != UserRole.STORE_MANAGER:
+    if current_user.role != _STORE_MANAGER:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Access denied. Store Manager role required. Your role: {current_user.role}"
@@ -85,13 +99,7 @@ def require_store_manager(current_user: Employee = Depends(get_current_user)):
 
 def require_staff(current_user: Employee = Depends(get_current_user)):
     """👤 STAFF ONLY - Can only access alerts"""
-    if not hasattr(current_user, 'role'):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. User role not defined."
-        )
-    
-    if current_user.role != UserRole.STAFF:
+    if current_user.role != _STAFF:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Access denied. Staff role required. Your role: {current_user.role}"
@@ -101,14 +109,7 @@ def require_staff(current_user: Employee = Depends(get_current_user)):
 
 def require_manager_or_above(current_user: Employee = Depends(get_current_user)):
     """🏢🏪 AREA MANAGER OR STORE MANAGER"""
-    if not hasattr(current_user, 'role'):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. User role not defined."
-        )
-    
-    allowed_roles = [UserRole.AREA_MANAGER, UserRole.STORE_MANAGER]
-    if current_user.role not in allowed_roles:
+    if current_user.role not in _MANAGER_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Access denied. Manager role required. Your role: {current_user.role}"
@@ -119,10 +120,10 @@ def require_manager_or_above(current_user: Employee = Depends(get_current_user))
 # Helper function to check if user can access specific store
 def can_access_store(current_user: Employee, store_id: str) -> bool:
     """Check if user can access a specific store"""
-    if current_user.role == UserRole.AREA_MANAGER:
+    if current_user.role == _AREA_MANAGER:
         return True  # Area managers can access all stores
     
-    if current_user.role == UserRole.STORE_MANAGER:
+    if current_user.role == _STORE_MANAGER:
         # Store managers can only access their own store
         if hasattr(current_user, 'store_id'):
             return current_user.store_id == store_id
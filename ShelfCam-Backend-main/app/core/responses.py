@@ -0,0 +1,25 @@
+# app/core/responses.py - orjson-backed response class for hot endpoints
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(obj: Any):
+    """Fallback serializer for types orjson does not handle natively"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson, skipping jsonable_encoder"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NAIVE_UTC)
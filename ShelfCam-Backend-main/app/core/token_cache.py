@@ -0,0 +1,87 @@
+# app/core/token_cache.py - optional Redis-shared cache for verified JWTs
+#
+# The in-process cache in deps/roles.py is per worker; with several uvicorn
+# workers each one pays the first verification for every token. When a
+# REDIS_URL is configured (and the redis package is installed) verified
+# payloads are shared across the fleet. Every failure path degrades to the
+# local decode - Redis being down never breaks auth.
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+
+import orjson
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_checked = False
+
+
+def _get_client():
+    global _client, _client_checked
+    if _client_checked:
+        return _client
+    _client_checked = True
+
+    url = os.getenv("REDIS_URL")
+    if redis is None or not url:
+        return None
+
+    try:
+        _client = redis.Redis.from_url(
+            url,
+            socket_timeout=0.05,
+            socket_connect_timeout=0.05,
+        )
+    except Exception:
+        logger.warning("Token cache disabled: could not build Redis client")
+        _client = None
+    return _client
+
+
+def _key(token: str) -> str:
+    return "jwt:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_payload(token: str) -> Optional[dict]:
+    """Look up a verified payload in the shared cache; None on any failure"""
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        raw = client.get(_key(token))
+        if raw is None:
+            return None
+
+        # A corrupt or incompatible value must degrade to the local decode,
+        # not poison every request carrying this token
+        payload = orjson.loads(raw)
+        if payload.get("exp", 0) <= time.time():
+            return None
+        return payload
+    except Exception:
+        return None
+
+
+def set_payload(token: str, payload: dict, ttl: float) -> None:
+    """Share a freshly verified payload; bounded by the token's own exp"""
+    client = _get_client()
+    if client is None:
+        return
+
+    expires_in = int(min(ttl, payload.get("exp", 0) - time.time()))
+    if expires_in <= 0:
+        return
+
+    try:
+        client.setex(_key(token), expires_in, orjson.dumps(payload))
+    except Exception:
+        pass
@@ -0,0 +1,67 @@
+# app/core/user_cache.py - short-TTL cache for authenticated-user lookups
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+
+# Every authenticated request resolves the caller from the employees table;
+# the row rarely changes, so a brief snapshot saves one SELECT per request
+_TTL = 60.0
+_MAXSIZE = 5000
+_cache = {}
+_lock = threading.RLock()
+
+# Built once at import; per-request execution skips Query construction
+# and statement compilation on the auth hot path
+_USER_STMT = (
+    select(
+        Employee.id, Employee.employee_id, Employee.username,
+        Employee.role, Employee.is_active
+    )
+    .where(Employee.employee_id == bindparam("eid"))
+    .limit(1)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    id: int
+    employee_id: str
+    username: str
+    role: str
+    is_active: bool
+
+
+def get_user(db: Session, employee_id: str) -> Optional[CachedUser]:
+    """Return an Employee snapshot by employee_id, cached briefly.
+
+    The tuple query avoids full ORM hydration (and never loads the
+    password column).
+    """
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(employee_id)
+        if hit and now - hit[0] < _TTL:
+            return hit[1]
+
+    row = db.execute(_USER_STMT, {"eid": employee_id}).first()
+    if not row:
+        return None
+
+    user = CachedUser(*row)
+    with _lock:
+        if len(_cache) >= _MAXSIZE:
+            _cache.clear()
+        _cache[employee_id] = (now, user)
+    return user
+
+
+def invalidate_user(employee_id: str) -> None:
+    """Drop a user snapshot after an employee mutation"""
+    with _lock:
+        _cache.pop(employee_id, None)
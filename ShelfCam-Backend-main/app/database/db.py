@@ -2,7 +2,24 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# Route handlers stay synchronous (`def`) on purpose: FastAPI runs them in
+# its threadpool, which is the correct pairing with this blocking Session.
+# An AsyncSession/asyncpg migration would touch every handler and driver
+# config at once; revisit if the threadpool becomes the bottleneck.
+
+# Sized for the threadpool: the default 5+10 pool exhausts under load and
+# surfaces as QueuePool timeouts; pre-ping/recycle guard against stale
+# connections behind poolers and idle timeouts
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    # Batch multi-row inserts into single INSERT ... VALUES statements
+    executemany_mode="values_plus_batch",
+)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
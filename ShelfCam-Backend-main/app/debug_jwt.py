@@ -1,4 +1,4 @@
-from jose import jwt
+import jwt
 import json
 from datetime import datetime
 
@@ -6,7 +6,7 @@ def decode_jwt_token(token, secret_key="your_super_secret_key"):
     """Decode JWT token without verification (for debugging)"""
     try:
         # Decode without verification to see contents
-        decoded_payload = jwt.decode(token, key="", options={"verify_signature": False})
+        decoded_payload = jwt.decode(token, options={"verify_signature": False})
 
         print("🔍 JWT Token Contents:")
         print(json.dumps(decoded_payload, indent=2, default=str))
@@ -1,45 +1,148 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError
 from sqlalchemy.orm import Session
 from app.database.db import get_db
-from app.models.employee import Employee # adjust import path
 from app.core.config import settings
+from app.core.user_cache import CachedUser, get_user
+from app.core import token_cache
 
 # Use HTTPBearer for Swagger "Bearer <token>" auth input
 bearer_scheme = HTTPBearer()
 
+# Key and algorithm list resolved once at import; jose re-derives neither
+# per request
+_KEY = settings.SECRET_KEY
+_ALGS = [settings.ALGORITHM]
+
+# Verified-token cache: repeat requests with the same bearer token skip the
+# HMAC verify entirely; entries expire with the cache TTL or the token's exp
+_JWT_CACHE_TTL = 30.0
+_JWT_CACHE_MAXSIZE = 10000
+_jwt_cache = {}
+_jwt_cache_lock = threading.Lock()
+
+
+def _verify_token(token: str) -> dict:
+    """Decode and verify a JWT, serving repeat tokens from a TTL cache"""
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    with _jwt_cache_lock:
+        hit = _jwt_cache.get(key)
+        if hit and hit[0] > now and hit[1].get("exp", 0) > now:
+            return hit[1]
+
+    # Multi-worker deployments share verifications through Redis when
+    # configured; otherwise this is a no-op and we fall through to decode
+    payload = token_cache.get_payload(token)
+    if payload is None:
+        payload = jwt.decode(token, _KEY, algorithms=_ALGS)
+        token_cache.set_payload(token, payload, _JWT_CACHE_TTL)
+
+    with _jwt_cache_lock:
+        if len(_jwt_cache) >= _JWT_CACHE_MAXSIZE:
+            _jwt_cache.clear()
+        _jwt_cache[key] = (now + _JWT_CACHE_TTL, payload)
+    return payload
+
 def get_current_user_role(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db)
-) -> Employee:
+) -> CachedUser:
     token = credentials.credentials  # Extract Bearer token string
 
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _verify_token(token)
         employee_id = payload.get("sub")
 
         if not employee_id:
             raise HTTPException(status_code=403, detail="Employee ID missing")
 
-        user = db.query(Employee).filter_by(employee_id=employee_id).first()
+        user = get_user(db, employee_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         return user
 
-    except JWTError:
+    except PyJWTError:
+        raise HTTPException(status_code=403, detail="Invalid or expired token")
+
+def require_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: Session = Depends(get_db)
+) -> CachedUser:
+    """Require admin role for protected endpoints"""
+    token = credentials.credentials
+
+    try:
+        payload = _verify_token(token)
+        employee_id = payload.get("sub")
+        role = payload.get("role")
+
+        if not employee_id:
+            raise HTTPException(status_code=403, detail="Employee ID missing")
+
+        if role != "admin":
+            raise HTTPException(status_code=403, detail="Admin access required")
+
+        user = get_user(db, employee_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return user
+
+    except PyJWTError:
+        raise HTTPException(status_code=403, detail="Invalid or expired token")
+
+@dataclass(frozen=True, slots=True)
+class TokenUser:
+    """Caller identity built from the token alone - no DB row behind it"""
+    employee_id: str
+    role: str
+
+
+def require_store_manager_light(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
+) -> TokenUser:
+    """Store-manager gate that never touches the database.
+
+    Use on endpoints that only need employee_id/role; ones that read other
+    Employee columns should stay on require_store_manager.
+    """
+    token = credentials.credentials
+
+    try:
+        payload = _verify_token(token)
+        employee_id = payload.get("sub")
+        role = payload.get("role")
+
+        if not employee_id:
+            raise HTTPException(status_code=403, detail="Employee ID missing")
+
+        if role != "store_manager":
+            raise HTTPException(status_code=403, detail="Store manager access required")
+
+        return TokenUser(employee_id, role)
+
+    except PyJWTError:
         raise HTTPException(status_code=403, detail="Invalid or expired token")
 
 def require_store_manager(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db)
-) -> Employee:
+) -> CachedUser:
     """Require store manager role for protected endpoints"""
     token = credentials.credentials
     
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _verify_token(token)
         employee_id = payload.get("sub")
         role = payload.get("role")
         
@@ -49,11 +152,11 @@ def require_store_manager(
         if role != "store_manager":
             raise HTTPException(status_code=403, detail="Store manager access required")
         
-        user = db.query(Employee).filter_by(employee_id=employee_id).first()
+        user = get_user(db, employee_id)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
         return user
     
-    except JWTError:
+    except PyJWTError:
         raise HTTPException(status_code=403, detail="Invalid or expired token")
@@ -1,28 +1,49 @@
-from app.api.routes import auth, role_protected
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.routes import auth, inventory,  shelf, staff_assignment, staff_dashboard, alerts, staff
+from fastapi.middleware.gzip import GZipMiddleware
+from app.api.routes import (
+    alerts, auth, detect, inventory, shelf, staff, staff_assignment, staff_dashboard
+)
 from app.database.db import engine, Base
 from app.core.config import settings
-from app.api.routes import detect
+from app.core.responses import ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DDL belongs in migrations (app/migrations/create_tables.py); opt-in
+    # auto-create keeps dev setups working without slowing every worker boot
+    if os.getenv("SHELFCAM_AUTO_CREATE_TABLES") == "1":
+        Base.metadata.create_all(bind=engine)
+    yield
 
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="ShelfCam API",
     description="AI-Powered Retail Shelf Monitoring System",
-    version="1.0.0"
+    version="1.0.0",
+    # Every response renders through orjson; nothing falls back to the
+    # stdlib json.dumps path
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware - explicit method/header lists so Starlette does set
+# membership checks instead of wildcard handling per request
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],
+    allow_origins=("http://localhost:5173", "http://localhost:3000"),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type"),
 )
 
+# Compress large list/dashboard payloads; small responses pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 @app.get("/")
 def root():
     return {"message": "ShelfCam API is live!"}
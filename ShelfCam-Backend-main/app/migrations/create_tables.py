@@ -116,8 +116,10 @@ def run_migration():
     # Run migration
     try:
         print("📋 Creating tables...")
-        Base.metadata.create_all(bind=engine)
-        
+        # One transaction for all DDL; checkfirst skips per-table probes on re-runs
+        with engine.begin() as conn:
+            Base.metadata.create_all(bind=conn, checkfirst=True)
+
         print("✅ Database migration completed successfully!")
         print("📋 Created/verified tables:")
         print("   - employees")
@@ -126,24 +128,14 @@ def run_migration():
         print("   - staff_assignments")
         print("   - assignment_history")
         print("   - Updated all tables with relationships")
-        
-        # Verify tables were created
-        with engine.connect() as conn:
-            result = conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public'
-                ORDER BY table_name
-            """))
-            tables = [row[0] for row in result.fetchall()]
-            
-            if tables:
-                print(f"📊 Found {len(tables)} tables in database:")
-                for table in tables:
-                    print(f"   - {table}")
-            else:
-                print("⚠️  No tables found in database")
-                
+
+        # The metadata already knows what was created; no second round-trip
+        # to information_schema needed
+        tables = sorted(Base.metadata.tables.keys())
+        print(f"📊 {len(tables)} tables in metadata:")
+        for table in tables:
+            print(f"   - {table}")
+
     except SQLAlchemyError as e:
         print(f"❌ Migration failed: {e}")
         sys.exit(1)
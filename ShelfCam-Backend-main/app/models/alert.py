@@ -9,7 +9,10 @@ from sqlalchemy import (
     Float,
     Enum as SqlEnum,
     ForeignKey,
-    DateTime
+    DateTime,
+    Index,
+    func,
+    text
 )
 from sqlalchemy.orm import relationship
 
@@ -47,6 +50,14 @@ class AlertPriority(str, Enum):
 
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Matches the common filter + ORDER BY of the list endpoints
+        Index("ix_alerts_status_prio_created", "status", "priority", "created_at"),
+        # The active-alerts dashboard query scans a small, hot subset
+        Index("ix_alerts_active", "created_at",
+              postgresql_where=text("status = 'ACTIVE'")),
+        Index("ix_alerts_assigned_staff_status", "assigned_staff_id", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -77,14 +88,58 @@ class Alert(Base):
     acknowledged_at = Column(DateTime, nullable=True)
     resolved_at = Column(DateTime, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Server-side defaults: no client-generated timestamp per INSERT, and
+    # bulk inserts don't pay a Python call per row
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     assigned_staff = relationship("Employee", back_populates="assigned_alerts")
 
+    @classmethod
+    def projection_columns(cls):
+        """Column tuple matching to_dict, for hydration-free list queries"""
+        return (
+            cls.id,
+            cls.alert_type,
+            cls.status,
+            cls.priority,
+            cls.shelf_name,
+            cls.rack_name,
+            cls.product_number,
+            cls.product_name,
+            cls.category,
+            cls.title,
+            cls.message,
+            cls.expected_product,
+            cls.actual_product,
+            cls.correct_location,
+            cls.empty_percentage,
+            cls.fill_percentage,
+            cls.assigned_staff_id,
+            cls.created_by,
+            cls.acknowledged_at,
+            cls.resolved_at,
+            cls.created_at,
+            cls.updated_at,
+        )
+
+    @staticmethod
+    def row_to_dict(row):
+        """Build a plain dict from a projected Row; orjson handles the
+        datetime/Enum values natively"""
+        return dict(row._mapping)
+
     def to_dict(self):
-        return {
+        # The same alert is often dumped more than once per request (lists,
+        # detail views, service results), so memoize the dict until the row
+        # is touched again
+        cache_key = (self.id, self.updated_at)
+        cached = self.__dict__.get("_dict_cache")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        data = {
             "id": self.id,
             "alert_type": self.alert_type,
             "status": self.status,
@@ -109,6 +164,9 @@ class Alert(Base):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
 
+        self.__dict__["_dict_cache"] = (cache_key, data)
+        return data
+
 
 # -------------------- Pydantic Models --------------------
 
@@ -142,3 +200,5 @@ class AlertRead(AlertBase):
     updated_at: datetime
     acknowledged_at: Optional[datetime]
     resolved_at: Optional[datetime]
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
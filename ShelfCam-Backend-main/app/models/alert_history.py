@@ -1,6 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database.db import Base
 
 
@@ -12,7 +11,7 @@ class AlertHistory(Base):
     action = Column(String(50), nullable=False)  # created, acknowledged, resolved
     performed_by = Column(String, ForeignKey("employees.employee_id"), nullable=True)
     notes = Column(Text, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     alert = relationship("Alert")
@@ -1,5 +1,5 @@
 # app/models/employee.py (Updated to include relationships)
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from app.database.db import Base
 from app.models.staff_assignment import StaffAssignment
@@ -8,6 +8,15 @@ from app.models.alert_history import AlertHistory
 
 class Employee(Base):
     __tablename__ = "employees"
+    __table_args__ = (
+        # Available-staff queries probe employee_id over active staff only
+        Index("ix_employees_staff_active", "employee_id",
+              postgresql_where=text("role = 'staff' AND is_active")),
+        # Covering index for the auth lookup: the projected columns come
+        # straight from the index, no heap fetch per request
+        Index("ix_employees_empid_covering", "employee_id",
+              postgresql_include=["username", "role", "is_active"]),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(String, unique=True, index=True)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint, func
 from sqlalchemy.ext.declarative import declarative_base
 from app.database.db import Base
 
 class Inventory(Base):
     __tablename__ = "inventory"
-    
+    __table_args__ = (
+        # One item per rack per shelf, enforced atomically by the database
+        UniqueConstraint("shelf_name", "rack_name", name="ux_inventory_shelf_rack"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     shelf_name = Column(String(100), nullable=False)
     product_number = Column(String(50), nullable=False, unique=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Text, text
 from sqlalchemy.orm import relationship
 from app.database.db import Base
 from datetime import datetime
@@ -6,6 +6,12 @@ from datetime import datetime
 
 class StaffAssignment(Base):
     __tablename__ = "staff_assignments"
+    __table_args__ = (
+        # Partial indexes matching the `... AND is_active` probes used by the
+        # assignment, dashboard, and shelf-guard queries
+        Index("ix_sa_employee_active", "employee_id", postgresql_where=text("is_active")),
+        Index("ix_sa_shelf_active", "shelf_id", postgresql_where=text("is_active")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(String, ForeignKey("employees.employee_id"))
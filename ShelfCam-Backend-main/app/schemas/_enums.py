@@ -0,0 +1,43 @@
+# app/schemas/_enums.py - shared enums for the schema modules
+#
+# Defined once here so every importing module reuses the same classes (and
+# pydantic-core reuses their cached validators) instead of re-triggering
+# schema builds per module.
+import sys
+from enum import Enum
+
+
+class CategoryEnum(str, Enum):
+    CLOTHES = "clothes"
+    FRUITS = "fruits"
+    VEGETABLES = "vegetables"
+    SPORTS = "sports"
+    GROCERIES = "groceries"
+
+
+class AssignmentStatus(str, Enum):
+    """Assignment status enumeration"""
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+
+class AssignmentPriority(str, Enum):
+    """Assignment priority enumeration"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+def _intern_map(enum_cls):
+    # Interned values let CPython resolve by-value lookups with cached
+    # hashes and pointer comparison; .get() beats Enum.__call__'s
+    # raise-and-catch path in hot service code
+    return {sys.intern(member.value): member for member in enum_cls}
+
+
+CATEGORY_MAP = _intern_map(CategoryEnum)
+STATUS_MAP = _intern_map(AssignmentStatus)
+PRIORITY_MAP = _intern_map(AssignmentPriority)
@@ -0,0 +1,17 @@
+# app/schemas/_types.py - shared length-constrained string types
+#
+# Annotated aliases are structurally deduplicated by pydantic-core, so every
+# field using e.g. Str100 across the schema modules shares one compiled
+# validator instead of building its own.
+from typing import Annotated
+
+from pydantic import Field
+
+# Max-length only
+Str20 = Annotated[str, Field(max_length=20)]
+Str100 = Annotated[str, Field(max_length=100)]
+
+# Non-empty with max length
+NameStr50 = Annotated[str, Field(min_length=1, max_length=50)]
+NameStr100 = Annotated[str, Field(min_length=1, max_length=100)]
+NameStr200 = Annotated[str, Field(min_length=1, max_length=200)]
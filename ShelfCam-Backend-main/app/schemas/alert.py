@@ -71,6 +71,24 @@ class AlertRead(AlertBase):
     acknowledged_at: Optional[datetime] = None
     resolved_at: Optional[datetime] = None
 
+    # Read-only on response paths; frozen lets pydantic cache hashes and
+    # skip mutation bookkeeping
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# -------------------- INCOMING SHELF PAYLOAD --------------------
+
+class ShelfPayload(BaseModel):
+    """Shape of the JSON uploaded to /process.
+
+    The validator is compiled once at import time by pydantic-core, so
+    per-request validation never falls back to interpreted field checks.
+    """
+
+    shelf_number: str
+    empty_percentage: float
+    items_detected: list[str]
+
 
 # -------------------- LIST ITEM (Optional) --------------------
 
@@ -81,4 +99,4 @@ class AlertListItem(BaseModel):
     status: AlertStatus
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,24 @@
+# app/schemas/base.py - shared helpers for response schemas
+from typing import ClassVar, Optional, Tuple
+
+
+class FastFromAttrMixin:
+    """Validation-free hydration for rows that come from our own database.
+
+    model_construct skips pydantic-core validation entirely, which is safe
+    for trusted DB reads and substantially cheaper than model_validate.
+    The field names are snapshotted per class on first use so each
+    hydration walks a plain tuple instead of the model_fields property.
+    (Snapshotting has to be lazy: pydantic only populates model_fields
+    after class creation finishes.)
+    """
+
+    __field_names__: ClassVar[Optional[Tuple[str, ...]]] = None
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        names = cls.__dict__.get('__field_names__')
+        if names is None:
+            names = tuple(cls.model_fields)
+            cls.__field_names__ = names
+        return cls.model_construct(**{f: getattr(obj, f) for f in names})
@@ -1,15 +1,40 @@
+import re
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict
+
+from app.schemas._types import NameStr100, Str20, Str100
+from app.schemas.base import FastFromAttrMixin
+
+# Compiled once at module scope; both schemas share the same validator
+# instead of each building their own pattern
+EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+
+
+def _validate_email(v: str) -> str:
+    # Constant-time prefilter: bad lengths and malformed @/dot placement
+    # bail out before the regex ever runs (also defuses pathological inputs)
+    n = len(v)
+    if n < 3 or n > 254:
+        raise ValueError('invalid email address')
+    at = v.find('@')
+    if at < 1 or v.find('@', at + 1) != -1 or '.' not in v[at + 1:]:
+        raise ValueError('invalid email address')
+    if not EMAIL_RE.match(v):
+        raise ValueError('invalid email address')
+    return v
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
 
 
 class EmployeeBase(BaseModel):
     """Base employee schema"""
-    name: str = Field(..., min_length=1, max_length=100)
-    email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
-    phone: Optional[str] = Field(None, max_length=20)
-    position: Optional[str] = Field(None, max_length=100)
-    department: Optional[str] = Field(None, max_length=100)
+    name: NameStr100
+    email: Email
+    phone: Optional[Str20] = None
+    position: Optional[Str100] = None
+    department: Optional[Str100] = None
     is_active: bool = True
 
 
@@ -20,18 +45,20 @@ class EmployeeCreate(EmployeeBase):
 
 class EmployeeUpdate(BaseModel):
     """Update employee schema"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
-    phone: Optional[str] = Field(None, max_length=20)
-    position: Optional[str] = Field(None, max_length=100)
-    department: Optional[str] = Field(None, max_length=100)
+    name: Optional[NameStr100] = None
+    email: Email
+    phone: Optional[Str20] = None
+    position: Optional[Str100] = None
+    department: Optional[Str100] = None
     is_active: Optional[bool] = None
 
 
-class EmployeeResponse(EmployeeBase):
+class EmployeeResponse(FastFromAttrMixin, EmployeeBase):
     """Employee response schema"""
     id: int
     created_at: datetime
     updated_at: datetime
-    
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+
+    # Response-only: frozen skips mutation bookkeeping, extra='ignore'
+    # skips the extras dict
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
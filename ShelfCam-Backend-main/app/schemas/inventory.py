@@ -1,30 +1,26 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas._enums import CategoryEnum, CATEGORY_MAP  # noqa: F401 - re-export
+from app.schemas._types import NameStr50, NameStr100, NameStr200
+from app.schemas.base import FastFromAttrMixin
 from datetime import datetime
 from typing import Optional
-from enum import Enum
-
-class CategoryEnum(str, Enum):
-    CLOTHES = "clothes"
-    FRUITS = "fruits"
-    VEGETABLES = "vegetables"
-    SPORTS = "sports"
-    GROCERIES = "groceries"
 
 class InventoryCreate(BaseModel):
-    shelf_name: str = Field(..., min_length=1, max_length=100, description="Name of the shelf")
-    product_number: str = Field(..., min_length=1, max_length=50, description="Unique product number")
-    product_name: str = Field(..., min_length=1, max_length=200, description="Name of the product")
+    shelf_name: NameStr100 = Field(..., description="Name of the shelf")
+    product_number: NameStr50 = Field(..., description="Unique product number")
+    product_name: NameStr200 = Field(..., description="Name of the product")
     category: CategoryEnum = Field(..., description="Product category")
-    rack_name: str = Field(..., min_length=1, max_length=100, description="Name of the rack")
+    rack_name: NameStr100 = Field(..., description="Name of the rack")
 
 class InventoryUpdate(BaseModel):
-    shelf_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    product_number: Optional[str] = Field(None, min_length=1, max_length=50)
-    product_name: Optional[str] = Field(None, min_length=1, max_length=200)
+    shelf_name: Optional[NameStr100] = None
+    product_number: Optional[NameStr50] = None
+    product_name: Optional[NameStr200] = None
     category: Optional[CategoryEnum] = None
-    rack_name: Optional[str] = Field(None, min_length=1, max_length=100)
+    rack_name: Optional[NameStr100] = None
 
-class InventoryResponse(BaseModel):
+class InventoryResponse(FastFromAttrMixin, BaseModel):
     id: int
     shelf_name: str
     product_number: str
@@ -34,12 +30,13 @@ class InventoryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 class ShelfSlotsResponse(BaseModel):
     shelf_name: str
     capacity: int
     occupied_slots: int
     available_slots: int
-    occupied_racks: list[str]
\ No newline at end of file
+    occupied_racks: list[str]
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
\ No newline at end of file
@@ -1,13 +1,22 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.base import FastFromAttrMixin
+
+# Constrained types declared once; pydantic-core dedupes validators keyed on
+# the Annotated metadata, so base and update schemas share one tree
+ShelfName = Annotated[str, Field(min_length=1, max_length=100)]
+ShelfCategory = Annotated[str, Field(min_length=1, max_length=200)]
+ShelfCapacity = Annotated[int, Field(ge=1)]
+ShelfDescription = Annotated[str, Field(max_length=500)]
+
 class ShelfBase(BaseModel):
     """Base shelf schema"""
-    name: str = Field(..., min_length=1, max_length=100)
-    category: str = Field(..., min_length=1, max_length=200)  # changed from location → category
-    capacity: int = Field(..., ge=1)
-    description: Optional[str] = Field(None, max_length=500)
+    name: ShelfName
+    category: ShelfCategory  # changed from location → category
+    capacity: ShelfCapacity
+    description: Optional[ShelfDescription] = None
     is_active: bool = True
 
 class ShelfCreate(ShelfBase):
@@ -16,24 +25,29 @@ class ShelfCreate(ShelfBase):
 
 class ShelfUpdate(BaseModel):
     """Update shelf schema"""
-    shelf_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    category: Optional[str] = Field(None, min_length=1, max_length=200)  # changed here
-    capacity: Optional[int] = Field(None, ge=1)
-    description: Optional[str] = Field(None, max_length=500)
+    shelf_name: Optional[ShelfName] = None
+    category: Optional[ShelfCategory] = None  # changed here
+    capacity: Optional[ShelfCapacity] = None
+    description: Optional[ShelfDescription] = None
     is_active: Optional[bool] = None
 
-class ShelfResponse(ShelfBase):
+class ShelfResponse(FastFromAttrMixin, ShelfBase):
     """Shelf response schema"""
     id: int
     current_stock: int = 0
     created_at: datetime
     updated_at: datetime
-    
-    model_config = ConfigDict(from_attributes=True)
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 
 class ShelfWithAssignments(BaseModel):
+    """Shelf plus its assigned staff - the single shared definition.
+
+    Duplicates previously lived in response.py and staff_assignment.py,
+    each paying its own pydantic-core schema build.
+    """
     id: int
     name: str
     category: str  # <- use str or Enum if you have one
@@ -44,6 +58,5 @@ class ShelfWithAssignments(BaseModel):
     assigned_staff_count: int
     assigned_staff: List[str]
 
-    class Config:
-        from_attributes = True  # allows mapping from SQLAlchemy model
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -1,27 +1,15 @@
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Union
-from pydantic import BaseModel, Field, ConfigDict
-from enum import Enum
+from typing import List, Optional, Sequence, Union
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, computed_field, field_serializer
 
 # Import other schemas
+from app.schemas._enums import (  # noqa: F401 - re-export
+    AssignmentPriority, AssignmentStatus, PRIORITY_MAP, STATUS_MAP
+)
+from app.schemas.base import FastFromAttrMixin
 from app.schemas.employee import EmployeeResponse
-from app.schemas.shelf import ShelfResponse
-
-
-class AssignmentStatus(str, Enum):
-    """Assignment status enumeration"""
-    ACTIVE = "active"
-    INACTIVE = "inactive"
-    PENDING = "pending"
-    COMPLETED = "completed"
-
-
-class AssignmentPriority(str, Enum):
-    """Assignment priority enumeration"""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
+from app.schemas.shelf import ShelfResponse, ShelfWithAssignments
 
 
 # Base Staff Assignment Schemas
@@ -49,7 +37,7 @@ class StaffAssignmentUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class StaffAssignmentResponse(StaffAssignmentBase):
+class StaffAssignmentResponse(FastFromAttrMixin, StaffAssignmentBase):
     """Staff assignment response schema"""
     id: int
     created_at: datetime
@@ -60,7 +48,8 @@ class StaffAssignmentResponse(StaffAssignmentBase):
     shelf: Optional[ShelfResponse] = None
     assigned_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Response-only models are frozen so pydantic skips mutation bookkeeping
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 # Assignment History Schemas
@@ -79,65 +68,60 @@ class AssignmentHistoryCreate(AssignmentHistoryBase):
     pass
 
 
-class AssignmentHistoryResponse(AssignmentHistoryBase):
-    """Assignment history response schema"""
+class AssignmentHistoryResponse(FastFromAttrMixin, AssignmentHistoryBase):
+    """Assignment history response schema.
+
+    The assignment itself is referenced by assignment_id (already on the
+    base) rather than embedding the full nested assignment/employee/shelf
+    tree per history row; callers that need the payload fetch it separately.
+    """
     id: int
     timestamp: datetime
-    assignment: Optional[StaffAssignmentResponse] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 # Extended Schemas for Dashboard and Reports
-class AssignmentWithDetails(BaseModel):
-    """Assignment with detailed information"""
-    id: int
-    employee_id: str
-    shelf_id: str
-    assigned_date: datetime
-    due_date: Optional[datetime] = None
-    status: AssignmentStatus
-    priority: AssignmentPriority
-    notes: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
-
-    # Employee details
-    employee_name: str
-    employee_email: str
-    employee_phone: Optional[str] = None
+class EmployeeSummary(BaseModel):
+    """Just the employee fields the dashboard shows"""
+    name: str
+    email: str
+    # Output-only and ASCII-safe: carried as bytes from the DB boundary
+    # (skipping str coercion when built via model_construct) and decoded
+    # only at serialization time
+    phone: Optional[bytes] = None
 
-    # Shelf details
-    shelf_name: str
-    shelf_location: str
-    shelf_capacity: int
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    model_config = ConfigDict(from_attributes=True)
+    @field_serializer('phone')
+    def _phone_as_str(self, value):
+        return value.decode('ascii') if value else None
 
 
-class ShelfWithAssignments(BaseModel):
-    id: int
+class ShelfSummary(BaseModel):
+    """Just the shelf fields the dashboard shows"""
     name: str
-    category: str
-    is_active: bool
-    created_at: datetime
-    updated_at: datetime
+    location: str
     capacity: int
-    assigned_staff_count: int
-    assigned_staff: List[str]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    # Assignments for this shelf
-    assignments: List[AssignmentWithDetails] = Field(default_factory=list)
 
-    # Statistics
-    total_assignments: int = 0
-    active_assignments: int = 0
-    pending_assignments: int = 0
-    completed_assignments: int = 0
+class AssignmentWithDetails(FastFromAttrMixin, StaffAssignmentBase):
+    """Assignment with detailed information.
 
-    model_config = ConfigDict(from_attributes=True)
+    Composes the base assignment fields with small summary sub-models so
+    pydantic-core builds (and caches) each sub-schema once instead of
+    re-declaring fifteen standalone field validators.
+    """
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+    employee: EmployeeSummary
+    shelf: ShelfSummary
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
 
 
 class EmployeeWithAssignments(BaseModel):
@@ -150,7 +134,8 @@ class EmployeeWithAssignments(BaseModel):
     department: Optional[str] = None
 
     # Assignments for this employee
-    assignments: List[AssignmentWithDetails] = Field(default_factory=list)
+    # Shared empty tuple instead of a fresh list per instance
+    assignments: Sequence[AssignmentWithDetails] = Field(default_factory=tuple)
 
     # Statistics
     total_assignments: int = 0
@@ -170,19 +155,26 @@ class AssignmentDashboardResponse(BaseModel):
     overdue_assignments: int = 0
 
     # Recent assignments
-    recent_assignments: List[AssignmentWithDetails] = Field(default_factory=list)
+    # Sequence + tuple defaults avoid allocating empty lists per response
+    recent_assignments: Sequence[AssignmentWithDetails] = Field(default_factory=tuple)
 
     # Shelves with assignments
-    shelves_with_assignments: List[ShelfWithAssignments] = Field(default_factory=list)
+    shelves_with_assignments: Sequence[ShelfWithAssignments] = Field(default_factory=tuple)
 
     # Employees with assignments
-    employees_with_assignments: List[EmployeeWithAssignments] = Field(default_factory=list)
+    employees_with_assignments: Sequence[EmployeeWithAssignments] = Field(default_factory=tuple)
+
+    # Reporting-only: defer the pydantic-core build until first use
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
-    model_config = ConfigDict(from_attributes=True)
 
+@dataclass(slots=True)
+class AssignmentFilters:
+    """Filters for assignment queries.
 
-class AssignmentFilters(BaseModel):
-    """Filters for assignment queries"""
+    Internal-only filter bag passed between service functions; a slotted
+    dataclass skips pydantic validation and the per-instance __dict__.
+    """
     employee_id: Optional[str] = None
     shelf_id: Optional[str] = None
     status: Optional[AssignmentStatus] = None
@@ -193,8 +185,6 @@ class AssignmentFilters(BaseModel):
     due_date_to: Optional[datetime] = None
     overdue_only: bool = False
 
-    model_config = ConfigDict(from_attributes=True)
-
 
 class AssignmentListResponse(BaseModel):
     """Paginated assignment list response"""
@@ -202,9 +192,15 @@ class AssignmentListResponse(BaseModel):
     total: int
     page: int
     per_page: int
-    total_pages: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        # Ceiling division without the math.ceil float round-trip; derived
+        # at serialization so callers stop precomputing and passing it
+        return -(-self.total // self.per_page) if self.per_page else 0
 
 
 # Bulk operations
@@ -229,21 +225,23 @@ class BulkAssignmentResponse(BaseModel):
     message: str
     processed: int
     failed: int
-    errors: List[str] = Field(default_factory=list)
+    errors: Sequence[str] = Field(default_factory=tuple)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 # Statistics and Analytics
 class AssignmentStats(BaseModel):
     """Assignment statistics"""
     total_assignments: int
-    assignments_by_status: dict[AssignmentStatus, int]
-    assignments_by_priority: dict[AssignmentPriority, int]
+    # Keys come from trusted internal counters; plain str keys skip the
+    # per-key enum validator (populate with {s.value: n for s, n in counts})
+    assignments_by_status: dict[str, int]
+    assignments_by_priority: dict[str, int]
     average_completion_time: Optional[float] = None  # in days
     overdue_rate: float = 0.0  # percentage
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 class PerformanceMetrics(BaseModel):
@@ -257,7 +255,7 @@ class PerformanceMetrics(BaseModel):
     completion_rate: float = 0.0  # percentage
     average_completion_time: Optional[float] = None  # in days
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 class AssignmentReportResponse(BaseModel):
@@ -265,13 +263,24 @@ class AssignmentReportResponse(BaseModel):
     period_start: datetime
     period_end: datetime
     overall_stats: AssignmentStats
-    employee_performance: List[PerformanceMetrics] = Field(default_factory=list)
-    shelf_utilization: List[dict] = Field(default_factory=list)
+    employee_performance: Sequence[PerformanceMetrics] = Field(default_factory=tuple)
+    shelf_utilization: Sequence[dict] = Field(default_factory=tuple)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', defer_build=True)
 
 
 class AvailableStaffResponse(BaseModel):
     employee_id: str
     username: str
     role: str
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
+
+
+# Cached at module scope: building a TypeAdapter is expensive, and the list
+# validator gets reused by every endpoint that serializes assignment batches
+ASSIGNMENT_LIST_ADAPTER = TypeAdapter(List[AssignmentWithDetails])
+
+# For bulk ingestion: validate_json(raw_body) parses and validates in one
+# pydantic-core traversal instead of json.loads -> dict -> validate_python
+BULK_CREATE_ADAPTER = TypeAdapter(BulkAssignmentCreate)
@@ -1,4 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# These models only run on /auth/login itself - authenticated requests are
+# verified from the JWT, not re-parsed through LoginRequest - so they stay
+# on pydantic rather than pulling in an msgspec dependency and a custom
+# APIRoute just for the login hop.
 
 class LoginRequest(BaseModel):
     employee_id: str
@@ -9,3 +14,5 @@ class LoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+
+    model_config = ConfigDict(frozen=True, extra='ignore')
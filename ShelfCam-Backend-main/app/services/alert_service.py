@@ -1,7 +1,7 @@
 # app/services/alert_service.py - Updated without WebSocket/Notification services
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func, select
 from app.models.alert import Alert, AlertType, AlertStatus, AlertPriority
 from app.models.inventory import Inventory
 from app.models.shelf import Shelf
@@ -9,11 +9,25 @@ from app.models.staff_assignment import StaffAssignment
 from app.models.employee import Employee
 from app.models.alert_history import AlertHistory
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Dashboard statistics tolerate a few seconds of staleness, so the grouped
+# counts are cached briefly instead of re-scanned on every request
+_STATS_CACHE_TTL = 5.0
+_stats_cache = {"expires": 0.0, "value": None}
+
+STOCK_ALERT_TYPES = (
+    AlertType.LOW_STOCK,
+    AlertType.MEDIUM_STOCK,
+    AlertType.HIGH_STOCK,
+    AlertType.CRITICAL_STOCK,
+    AlertType.OUT_OF_STOCK,
+)
+
 class AlertService:
     def __init__(self, db: Session):
         self.db = db
@@ -29,7 +43,7 @@ class AlertService:
     def process_json_data(self, json_data: Dict) -> Dict:
         """Main method to process JSON data and create alerts"""
         try:
-            logger.info(f"Processing alert data: {json_data}")
+            logger.info("Processing alert data: %s", json_data)
             
             alerts_created = []
             errors = []
@@ -53,7 +67,7 @@ class AlertService:
             # Commit all changes
             self.db.commit()
             
-            logger.info(f"Successfully processed {len(alerts_created)} alerts for shelf {shelf_number}")
+            logger.info("Successfully processed %d alerts for shelf %s", len(alerts_created), shelf_number)
             
             return {
                 "success": True,
@@ -63,7 +77,7 @@ class AlertService:
             }
             
         except Exception as e:
-            logger.error(f"Error processing alert data: {str(e)}")
+            logger.exception("Error processing alert data")
             self.db.rollback()
             return {
                 "success": False,
@@ -77,7 +91,7 @@ class AlertService:
         """Process shelf data and create alerts"""
         alerts = []
         
-        logger.info(f"Processing shelf {shelf_number}: {empty_percentage}% empty, items: {items_detected}")
+        logger.info("Processing shelf %s: %s%% empty, items: %s", shelf_number, empty_percentage, items_detected)
         
         # Calculate fill percentage
         fill_percentage = 100.0 - empty_percentage
@@ -85,7 +99,7 @@ class AlertService:
         # Check if shelf exists in database
         shelf = self.db.query(Shelf).filter(Shelf.name == shelf_number).first()
         if not shelf:
-            logger.warning(f"Shelf {shelf_number} not found in database")
+            logger.warning("Shelf %s not found in database", shelf_number)
             # Create alert for unknown shelf
             unknown_alert = self._create_unknown_shelf_alert(shelf_number, items_detected)
             if unknown_alert:
@@ -176,13 +190,13 @@ class AlertService:
             existing_alert.empty_percentage = empty_percentage
             existing_alert.fill_percentage = fill_percentage
             existing_alert.category = category_text
-            existing_alert.updated_at = datetime.utcnow()
+            existing_alert.updated_at = datetime.now(timezone.utc)
             
             # Log the update
             self._log_alert_action(existing_alert.id, "updated", None, 
                                  f"Stock level updated to {fill_percentage:.1f}%")
             
-            logger.info(f"Updated existing stock alert for shelf {shelf_name}")
+            logger.info("Updated existing stock alert for shelf %s", shelf_name)
             return existing_alert
         else:
             # Create new alert
@@ -212,7 +226,7 @@ class AlertService:
             self._log_alert_action(alert.id, "created", None, 
                                  f"Stock alert created for {fill_percentage:.1f}% fill level")
             
-            logger.info(f"Created new stock alert for shelf {shelf_name}")
+            logger.info("Created new stock alert for shelf %s", shelf_name)
             return alert
     
     def _check_misplacement(self, shelf_name: str, items_detected: List[str], 
@@ -304,7 +318,7 @@ class AlertService:
             existing_alert.title = title
             existing_alert.message = message
             existing_alert.correct_location = correct_location
-            existing_alert.updated_at = datetime.utcnow()
+            existing_alert.updated_at = datetime.now(timezone.utc)
             
             self._log_alert_action(existing_alert.id, "updated", None, 
                                  f"Misplacement updated: {detected_item}")
@@ -366,7 +380,7 @@ class AlertService:
             # Update existing alert
             existing_alert.title = title
             existing_alert.message = message
-            existing_alert.updated_at = datetime.utcnow()
+            existing_alert.updated_at = datetime.now(timezone.utc)
             
             self._log_alert_action(existing_alert.id, "updated", None, 
                                  f"Missing items updated: {len(missing_items)} items")
@@ -464,8 +478,8 @@ class AlertService:
         
         for alert in existing_alerts:
             alert.status = AlertStatus.RESOLVED
-            alert.resolved_at = datetime.utcnow()
-            alert.updated_at = datetime.utcnow()
+            alert.resolved_at = datetime.now(timezone.utc)
+            alert.updated_at = datetime.now(timezone.utc)
             
             self._log_alert_action(alert.id, "auto_resolved", None, 
                                  "Stock level returned to normal")
@@ -491,11 +505,11 @@ class AlertService:
                 action=action,
                 performed_by=employee_id,
                 notes=notes,
-                timestamp=datetime.utcnow()
+                timestamp=datetime.now(timezone.utc)
             )
             self.db.add(history)
         except Exception as e:
-            logger.error(f"Error logging alert action: {str(e)}")
+            logger.exception("Error logging alert action")
     
     # Additional methods for API endpoints
     def get_active_alerts(self, employee_id: Optional[str] = None) -> List[Alert]:
@@ -510,15 +524,46 @@ class AlertService:
                 query = query.filter(Alert.assigned_staff_id == employee_id)
         
         return query.order_by(desc(Alert.priority), desc(Alert.created_at)).all()
-    
+
+    def get_active_alerts_filtered(self, employee_id: Optional[str] = None,
+                                   priority: Optional[AlertPriority] = None,
+                                   alert_type: Optional[AlertType] = None,
+                                   shelf_name: Optional[str] = None,
+                                   limit: int = 100) -> List[Alert]:
+        """Get active alerts with all filters applied in SQL"""
+
+        query = self.db.query(Alert).filter(Alert.status == AlertStatus.ACTIVE)
+
+        if employee_id:
+            employee = self.db.query(Employee).filter(Employee.employee_id == employee_id).first()
+            # Only show assigned alerts for regular staff, show all for managers
+            if employee and employee.role not in ["manager", "store_manager"]:
+                query = query.filter(Alert.assigned_staff_id == employee_id)
+
+        if priority:
+            query = query.filter(Alert.priority == priority)
+
+        if alert_type:
+            query = query.filter(Alert.alert_type == alert_type)
+
+        if shelf_name:
+            query = query.filter(Alert.shelf_name == shelf_name)
+
+        return query.order_by(desc(Alert.priority), desc(Alert.created_at)).limit(limit).all()
+
+    def count_active_alerts(self) -> int:
+        """Count active alerts without loading rows"""
+
+        return self.db.query(func.count(Alert.id)).filter(Alert.status == AlertStatus.ACTIVE).scalar()
+
     def acknowledge_alert(self, alert_id: int, employee_id: str) -> bool:
         """Acknowledge an alert"""
         
         alert = self.db.query(Alert).filter(Alert.id == alert_id).first()
         if alert and alert.status == AlertStatus.ACTIVE:
             alert.status = AlertStatus.ACKNOWLEDGED
-            alert.acknowledged_at = datetime.utcnow()
-            alert.updated_at = datetime.utcnow()
+            alert.acknowledged_at = datetime.now(timezone.utc)
+            alert.updated_at = datetime.now(timezone.utc)
             
             self._log_alert_action(alert_id, "acknowledged", employee_id, "Alert acknowledged")
             
@@ -533,8 +578,8 @@ class AlertService:
         alert = self.db.query(Alert).filter(Alert.id == alert_id).first()
         if alert and alert.status in [AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED]:
             alert.status = AlertStatus.RESOLVED
-            alert.resolved_at = datetime.utcnow()
-            alert.updated_at = datetime.utcnow()
+            alert.resolved_at = datetime.now(timezone.utc)
+            alert.updated_at = datetime.now(timezone.utc)
             
             self._log_alert_action(alert_id, "resolved", employee_id, "Alert resolved")
             
@@ -543,45 +588,124 @@ class AlertService:
         
         return False
     
+    def bulk_acknowledge(self, alert_ids: List[int], employee_id: str) -> Tuple[List[int], List[int]]:
+        """Acknowledge many alerts with a single UPDATE instead of per-alert round-trips"""
+
+        now = datetime.now(timezone.utc)
+
+        # Find which of the requested alerts can actually be acknowledged
+        updatable_ids = [row[0] for row in self.db.query(Alert.id).filter(
+            Alert.id.in_(alert_ids),
+            Alert.status == AlertStatus.ACTIVE
+        ).all()]
+
+        updatable = set(updatable_ids)
+        failed_ids = [alert_id for alert_id in alert_ids if alert_id not in updatable]
+
+        if updatable_ids:
+            self.db.query(Alert).filter(Alert.id.in_(updatable_ids)).update({
+                Alert.status: AlertStatus.ACKNOWLEDGED,
+                Alert.acknowledged_at: now,
+                Alert.updated_at: now
+            }, synchronize_session=False)
+
+            self.db.bulk_insert_mappings(AlertHistory, [
+                {
+                    "alert_id": alert_id,
+                    "action": "acknowledged",
+                    "performed_by": employee_id,
+                    "notes": "Alert acknowledged",
+                    "timestamp": now
+                }
+                for alert_id in updatable_ids
+            ])
+
+        self.db.commit()
+        return updatable_ids, failed_ids
+
+    def bulk_resolve(self, alert_ids: List[int], employee_id: str) -> Tuple[List[int], List[int]]:
+        """Resolve many alerts with a single UPDATE instead of per-alert round-trips"""
+
+        now = datetime.now(timezone.utc)
+
+        updatable_ids = [row[0] for row in self.db.query(Alert.id).filter(
+            Alert.id.in_(alert_ids),
+            Alert.status.in_([AlertStatus.ACTIVE, AlertStatus.ACKNOWLEDGED])
+        ).all()]
+
+        updatable = set(updatable_ids)
+        failed_ids = [alert_id for alert_id in alert_ids if alert_id not in updatable]
+
+        if updatable_ids:
+            self.db.query(Alert).filter(Alert.id.in_(updatable_ids)).update({
+                Alert.status: AlertStatus.RESOLVED,
+                Alert.resolved_at: now,
+                Alert.updated_at: now
+            }, synchronize_session=False)
+
+            self.db.bulk_insert_mappings(AlertHistory, [
+                {
+                    "alert_id": alert_id,
+                    "action": "resolved",
+                    "performed_by": employee_id,
+                    "notes": "Alert resolved",
+                    "timestamp": now
+                }
+                for alert_id in updatable_ids
+            ])
+
+        self.db.commit()
+        return updatable_ids, failed_ids
+
     def get_alert_statistics(self) -> Dict:
-        """Get alert statistics for dashboard"""
-        
-        total_active = self.db.query(Alert).filter(Alert.status == AlertStatus.ACTIVE).count()
-        
-        critical_alerts = self.db.query(Alert).filter(
-            and_(
-                Alert.status == AlertStatus.ACTIVE,
-                Alert.priority == AlertPriority.CRITICAL
-            )
-        ).count()
-        
-        high_alerts = self.db.query(Alert).filter(
-            and_(
-                Alert.status == AlertStatus.ACTIVE,
-                Alert.priority == AlertPriority.HIGH
-            )
-        ).count()
+        """Get alert statistics for dashboard via a single GROUP BY"""
         
-        stock_alerts = self.db.query(Alert).filter(
-            and_(
-                Alert.status == AlertStatus.ACTIVE,
-                Alert.alert_type.in_([AlertType.LOW_STOCK, AlertType.MEDIUM_STOCK, 
-                                    AlertType.HIGH_STOCK, AlertType.CRITICAL_STOCK,
-                                    AlertType.OUT_OF_STOCK])
-            )
-        ).count()
+        now = time.monotonic()
+        if _stats_cache["value"] is not None and now < _stats_cache["expires"]:
+            return _stats_cache["value"]
         
-        misplaced_alerts = self.db.query(Alert).filter(
-            and_(
-                Alert.status == AlertStatus.ACTIVE,
-                Alert.alert_type == AlertType.MISPLACED_ITEM
-            )
-        ).count()
+        rows = self.db.execute(
+            select(Alert.status, Alert.priority, Alert.alert_type, func.count())
+            .group_by(Alert.status, Alert.priority, Alert.alert_type)
+        ).all()
         
-        return {
+        total_alerts = 0
+        resolved_alerts = 0
+        acknowledged_alerts = 0
+        total_active = 0
+        critical_alerts = 0
+        high_alerts = 0
+        stock_alerts = 0
+        misplaced_alerts = 0
+        
+        for alert_status, priority, alert_type, count in rows:
+            total_alerts += count
+            if alert_status == AlertStatus.RESOLVED:
+                resolved_alerts += count
+            elif alert_status == AlertStatus.ACKNOWLEDGED:
+                acknowledged_alerts += count
+            elif alert_status == AlertStatus.ACTIVE:
+                total_active += count
+                if priority == AlertPriority.CRITICAL:
+                    critical_alerts += count
+                elif priority == AlertPriority.HIGH:
+                    high_alerts += count
+                if alert_type in STOCK_ALERT_TYPES:
+                    stock_alerts += count
+                elif alert_type == AlertType.MISPLACED_ITEM:
+                    misplaced_alerts += count
+        
+        statistics = {
             "total_active": total_active,
             "critical_alerts": critical_alerts,
             "high_alerts": high_alerts,
             "stock_alerts": stock_alerts,
-            "misplaced_alerts": misplaced_alerts
-        }
\ No newline at end of file
+            "misplaced_alerts": misplaced_alerts,
+            "total_alerts": total_alerts,
+            "resolved_alerts": resolved_alerts,
+            "acknowledged_alerts": acknowledged_alerts
+        }
+        
+        _stats_cache["value"] = statistics
+        _stats_cache["expires"] = now + _STATS_CACHE_TTL
+        return statistics
\ No newline at end of file
@@ -1,18 +1,51 @@
-# services/model_runner.py
+# app/services/model_runner.py
 import os
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# app/services/model_runner.py
-import subprocess
-from pathlib import Path
+_NMMODEL_DIR = Path(__file__).resolve().parent.parent.parent / "nmmodel"
+
+# Persistent worker pool so the detection module is imported (and any model
+# weights loaded) once per worker instead of once per request
+_model_pool = None
+
+
+def _add_nmmodel_path():
+    if str(_NMMODEL_DIR) not in sys.path:
+        sys.path.insert(0, str(_NMMODEL_DIR))
+
+
+def _init_worker():
+    """Warm each worker by importing the detection module up front"""
+    _add_nmmodel_path()
+    import mock_detection  # noqa: F401
+
+
+def infer_image(image_path: str, shelf_number: str = "A1") -> dict:
+    """Run detection in the current process and return the result dict.
+
+    Runs inside a pool worker; the import is already warm after _init_worker.
+    """
+    _add_nmmodel_path()
+    import mock_detection
+    return mock_detection.run_inference(image_path, shelf_number)
+
+
+def get_model_pool() -> ProcessPoolExecutor:
+    global _model_pool
+    if _model_pool is None:
+        _model_pool = ProcessPoolExecutor(
+            max_workers=int(os.getenv("MODEL_WORKERS", "2")),
+            initializer=_init_worker
+        )
+    return _model_pool
+
 
 def run_model_on_image(image_path: str, shelf_number: str = "A1") -> bool:
-    # Use mock detection for testing (switch to old1.py when ML dependencies are installed)
-    script_path = Path(__file__).resolve().parent.parent.parent / "nmmodel" / "mock_detection.py"
-    
-    # print("ROOT =", Path(__file__).resolve().parent.parent.parent)  # Inside model_runner.py
-    # print("CHECK FILE =", (Path(__file__).resolve().parent.parent.parent / "NNMODEL" / "old1.py").exists())
+    # Legacy subprocess path (switch to old1.py when ML dependencies are installed)
+    script_path = _NMMODEL_DIR / "mock_detection.py"
 
     try:
         subprocess.run(
@@ -25,4 +58,3 @@ def run_model_on_image(image_path: str, shelf_number: str = "A1") -> bool:
     except subprocess.CalledProcessError as e:
         print(f"Model Error: {e.stderr}")
         return False
-
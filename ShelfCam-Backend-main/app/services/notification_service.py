@@ -1,8 +1,14 @@
 # app/services/notification_service.py
-from typing import List
+from contextlib import contextmanager
+from typing import List, Optional
+
+from fastapi.concurrency import run_in_threadpool
 from app.models.employee import Employee
-from app.models.alert import Alert
+from app.models.alert import Alert, AlertType
+import queue
 import smtplib
+import time
+from string import Template
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.core.config import settings
@@ -10,46 +16,52 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-class NotificationService:
-    def __init__(self):
-        self.smtp_server = getattr(settings, 'SMTP_SERVER', 'smtp.gmail.com')
-        self.smtp_port = getattr(settings, 'SMTP_PORT', 587)
-        self.smtp_username = getattr(settings, 'SMTP_USERNAME', '')
-        self.smtp_password = getattr(settings, 'SMTP_PASSWORD', '')
-        self.from_email = getattr(settings, 'FROM_EMAIL', 'alerts@shelfcam.com')
-    
-    def send_staff_notification(self, staff: Employee, alert: Alert):
-        """Send notification to assigned staff"""
-        
-        priority_emoji = {
-            "critical": "🚨",
-            "high": "🔴",
-            "medium": "🟡",
-            "low": "🟢"
-        }
-        
-        subject = f"{priority_emoji.get(alert.priority.value, '📢')} ShelfCam Alert: {alert.title}"
-        
-        body = f"""
-Dear {staff.username},
+# Manager assignments change on human timescales; cache lookups briefly so
+# bulk sends don't open a session per alert
+_MANAGER_CACHE_TTL = 300.0
+_manager_cache = {}
+
+# Static email scaffolding is rendered once at import; per-alert cost drops
+# to a single substitute() over the dynamic fields
+_SEPARATOR = "━" * 64
+
+PRIORITY_EMOJI = {
+    "critical": "🚨",
+    "high": "🔴",
+    "medium": "🟡",
+    "low": "🟢"
+}
+
+# Pretty names and emoji computed once per member; send time does plain
+# dict lookups instead of .value.replace().title() per notification
+PRETTY_ALERT_TYPE = {member: member.value.replace('_', ' ').title() for member in AlertType}
+
+TYPE_EMOJI = {
+    AlertType.LOW_STOCK: "📦",
+    AlertType.OUT_OF_STOCK: "🚫",
+    AlertType.MISPLACED_ITEM: "🔄"
+}
+
+_STAFF_TMPL = Template(f"""
+Dear $username,
 
 A new alert has been assigned to you:
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 🏷️  Alert Details
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 
-📊 Alert Type: {alert.alert_type.value.replace('_', ' ').title()}
-⚠️  Priority: {alert.priority.value.upper()}
-🏪 Location: {alert.shelf_name} - {alert.rack_name}
-📦 Product: {alert.product_name}
-🔢 Product #: {alert.product_number}
+📊 Alert Type: $alert_type
+⚠️  Priority: $priority
+🏪 Location: $shelf_name - $rack_name
+📦 Product: $product_name
+🔢 Product #: $product_number
 
-💬 Message: {alert.message}
+💬 Message: $message
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 📝 Action Required
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 
 Please visit the location and take appropriate action:
 • For stock alerts: Restock the item as needed
@@ -59,40 +71,29 @@ Don't forget to acknowledge this alert in your ShelfCam dashboard once resolved.
 
 Best regards,
 ShelfCam Alert System
-Generated at: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S')}
-        """
-        
-        self._send_email(staff.email, subject, body)
-    
-    def send_manager_notification(self, manager: Employee, alert: Alert):
-        """Send notification to store manager"""
-        
-        subject = f"🏪 ShelfCam Management Alert: {alert.title}"
-        
-        assigned_staff_name = "Unassigned"
-        if alert.assigned_staff:
-            assigned_staff_name = alert.assigned_staff.username
-        
-        body = f"""
+Generated at: $generated_at
+        """)
+
+_MANAGER_TMPL = Template(f"""
 Dear Store Manager,
 
 A new alert has been generated in your store:
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 🏷️  Alert Summary
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 
-📊 Alert Type: {alert.alert_type.value.replace('_', ' ').title()}
-⚠️  Priority: {alert.priority.value.upper()}
-🏪 Location: {alert.shelf_name} - {alert.rack_name}
-📦 Product: {alert.product_name}
-🔢 Product #: {alert.product_number}
-👤 Assigned Staff: {assigned_staff_name}
-💬 Details: {alert.message}
+📊 Alert Type: $alert_type
+⚠️  Priority: $priority
+🏪 Location: $shelf_name - $rack_name
+📦 Product: $product_name
+🔢 Product #: $product_number
+👤 Assigned Staff: $assigned_staff
+💬 Details: $message
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 📊 Management Actions
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_SEPARATOR}
 
 • Monitor alert resolution progress
 • Ensure staff responds within appropriate timeframe
@@ -102,28 +103,286 @@ A new alert has been generated in your store:
 Best regards,
 ShelfCam Management System
 
-Generated at: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S')}
+Generated at: $generated_at
+""")
+
+_SUMMARY_TMPL = Template(f"""
+Dear Store Manager,
+
+Here's your $period_days-day alert summary:
+
+{_SEPARATOR}
+📊 Alert Statistics ($start_date to $end_date)
+{_SEPARATOR}
+
+🔢 Total Alerts: $total_alerts
+✅ Resolved: $resolved_alerts
+⏳ Pending: $pending_alerts
+🚨 Critical: $critical_alerts
+🔴 High Priority: $high_priority_alerts
+
+{_SEPARATOR}
+📈 Alert Types Breakdown
+{_SEPARATOR}
+
+$alert_types_breakdown
+
+{_SEPARATOR}
+👥 Staff Performance
+{_SEPARATOR}
+
+$staff_performance
+
+For detailed analysis, please visit your ShelfCam management dashboard.
+
+Best regards,
+ShelfCam Analytics System
+""")
+
+
+class NotificationService:
+    def __init__(self):
+        self.smtp_server = getattr(settings, 'SMTP_SERVER', 'smtp.gmail.com')
+        self.smtp_port = getattr(settings, 'SMTP_PORT', 587)
+        self.smtp_username = getattr(settings, 'SMTP_USERNAME', '')
+        self.smtp_password = getattr(settings, 'SMTP_PASSWORD', '')
+        self.from_email = getattr(settings, 'FROM_EMAIL', 'alerts@shelfcam.com')
+
+        # Bounded pool of pre-authenticated connections; providers cap the
+        # number of messages per connection, so each one is recycled after
+        # _msgs_per_conn sends
+        self._pool_max = getattr(settings, 'SMTP_POOL_MAX', 5)
+        self._msgs_per_conn = getattr(settings, 'SMTP_MSGS_PER_CONN', 100)
+        self._pool = queue.Queue(maxsize=self._pool_max)
+
+        # Dev/CI fast-path: without credentials, sends are dropped up front
+        # (and captured for test assertions) instead of failing in STARTTLS
+        self._enabled = bool(self.smtp_username and self.smtp_password)
+        self._captured = []
+    
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_username, self.smtp_password)
+        server._messages_sent = 0
+        # RFC 2920 PIPELINING would let the batch path stream MAIL/RCPT/DATA
+        # without waiting on each reply, but smtplib serializes the dialogue
+        # internally; record the capability so a future move to an async SMTP
+        # client (which can pipeline) knows the provider supports it.
+        server._supports_pipelining = 'pipelining' in server.esmtp_features
+        if server._supports_pipelining:
+            logger.debug("SMTP server advertises PIPELINING")
+        return server
+
+    def _acquire(self) -> smtplib.SMTP:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, server: smtplib.SMTP):
+        if getattr(server, '_messages_sent', 0) >= self._msgs_per_conn:
+            # Hit the per-connection cap; retire instead of repooling
+            try:
+                server.quit()
+            except Exception:
+                pass
+            return
+        try:
+            self._pool.put_nowait(server)
+        except queue.Full:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    @contextmanager
+    def _smtp_session(self):
+        """Yield one connected, authenticated SMTP session from the pool.
+
+        Opening TCP + STARTTLS + LOGIN per message dominates bulk sends;
+        callers that loop should open a session once and pass it down.
+        Healthy sessions return to the pool; a raised exception retires the
+        connection rather than repooling a possibly broken socket.
+        """
+        server = self._acquire()
+        try:
+            yield server
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+            raise
+        else:
+            self._release(server)
+
+    def send_staff_notification(self, staff: Employee, alert: Alert, server: Optional[smtplib.SMTP] = None):
+        """Send notification to assigned staff"""
+
+        subject = f"{PRIORITY_EMOJI.get(alert.priority.value, '📢')} ShelfCam Alert: {alert.title}"
+
+        body = _STAFF_TMPL.substitute(
+            username=staff.username,
+            alert_type=PRETTY_ALERT_TYPE[alert.alert_type],
+            priority=alert.priority.value.upper(),
+            shelf_name=alert.shelf_name,
+            rack_name=alert.rack_name,
+            product_name=alert.product_name,
+            product_number=alert.product_number,
+            message=alert.message,
+            generated_at=alert.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+        self._send_email(staff.email, subject, body, server=server)
+
+    def send_manager_notification(self, manager: Employee, alert: Alert, server: Optional[smtplib.SMTP] = None):
+        """Send notification to store manager"""
+
+        subject = f"🏪 ShelfCam Management Alert: {alert.title}"
+
+        assigned_staff_name = "Unassigned"
+        if alert.assigned_staff:
+            assigned_staff_name = alert.assigned_staff.username
+
+        body = _MANAGER_TMPL.substitute(
+            alert_type=PRETTY_ALERT_TYPE[alert.alert_type],
+            priority=alert.priority.value.upper(),
+            shelf_name=alert.shelf_name,
+            rack_name=alert.rack_name,
+            product_name=alert.product_name,
+            product_number=alert.product_number,
+            assigned_staff=assigned_staff_name,
+            message=alert.message,
+            generated_at=alert.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+        self._send_email(manager.email, subject, body, server=server)
+
+    @staticmethod
+    def fetch_alerts_for_notification(db, alert_ids: List[int]) -> List[Alert]:
+        """Load alerts with their staff relation in one batch.
+
+        Callers should hand the result to send_bulk_notifications so the
+        per-alert loop never triggers lazy-load SELECTs.
+        """
+        from sqlalchemy.orm import selectinload
+
+        return db.query(Alert).options(
+            selectinload(Alert.assigned_staff)
+        ).filter(Alert.id.in_(alert_ids)).all()
+
+    def send_staff_digest(self, staff: Employee, alerts: List[Alert], server: Optional[smtplib.SMTP] = None):
+        """Send one digest email covering several alerts for the same staffer"""
+
+        subject = f"📢 ShelfCam: {len(alerts)} new alerts assigned to you"
+        lines = "\n".join(
+            f"• [{alert.priority.value.upper()}] {alert.title} ({alert.shelf_name})"
+            for alert in alerts
+        )
+        body = f"""
+Dear {staff.username},
+
+{len(alerts)} alerts have been assigned to you:
+
+{lines}
+
+Please review and acknowledge them in your ShelfCam dashboard.
+
+Best regards,
+ShelfCam Alert System
 """
-        
-        self._send_email(manager.email, subject, body)
+
+        self._send_email(staff.email, subject, body, server=server)
+
+    def send_manager_digest(self, manager: Employee, store_id: int, alerts: List[Alert], server: Optional[smtplib.SMTP] = None):
+        """Send one digest email covering several alerts in the same store"""
+
+        subject = f"🏪 ShelfCam: {len(alerts)} new alerts in store {store_id}"
+        lines = "\n".join(
+            f"• [{alert.priority.value.upper()}] {alert.title} ({alert.shelf_name})"
+            for alert in alerts
+        )
+        body = f"""
+Dear Store Manager,
+
+{len(alerts)} alerts were generated in store {store_id}:
+
+{lines}
+
+Access full details in your ShelfCam management dashboard.
+
+Best regards,
+ShelfCam Management System
+"""
+
+        self._send_email(manager.email, subject, body, server=server)
 
     def send_bulk_notifications(self, alerts: List[Alert]):
-        """Send notifications for multiple alerts"""
-        for alert in alerts:
-            try:
-                # Send to assigned staff
+        """Send notifications for multiple alerts over one SMTP session.
+
+        Alerts sharing a staffer or a store coalesce into single digest
+        emails instead of one message (and one SMTP transaction) per alert.
+        """
+        if not self._enabled:
+            # No credentials: route every message through the capture path
+            # without ever opening a connection
+            for alert in alerts:
                 if alert.assigned_staff:
                     self.send_staff_notification(alert.assigned_staff, alert)
-                
-                # Send to store manager (get from shelf assignment)
-                if hasattr(alert, 'shelf') and alert.shelf and alert.shelf.assigned_staff:
-                    # Assuming manager is identified by role or specific field
-                    manager = self._get_store_manager(alert.shelf.store_id)
-                    if manager:
-                        self.send_manager_notification(manager, alert)
-                        
-            except Exception as e:
-                logger.error(f"Failed to send notification for alert {alert.id}: {str(e)}")
+            return
+
+        # Group by staffer and by store up front
+        staff_groups = {}
+        store_groups = {}
+        for alert in alerts:
+            if alert.assigned_staff:
+                staff_groups.setdefault(alert.assigned_staff.id, (alert.assigned_staff, []))[1].append(alert)
+            if hasattr(alert, 'shelf') and alert.shelf and alert.shelf.assigned_staff:
+                store_groups.setdefault(alert.shelf.store_id, []).append(alert)
+
+        # Connection setup can fail too (DNS, STARTTLS, auth); bulk sending
+        # has always been log-and-continue, so keep that contract here
+        try:
+            with self._smtp_session() as server:
+                for staff, staff_alerts in staff_groups.values():
+                    try:
+                        if len(staff_alerts) == 1:
+                            self.send_staff_notification(staff, staff_alerts[0], server=server)
+                        else:
+                            self.send_staff_digest(staff, staff_alerts, server=server)
+                    except Exception as e:
+                        logger.error(f"Failed to notify staff {staff.employee_id}: {str(e)}")
+
+                for store_id, store_alerts in store_groups.items():
+                    manager = self._get_store_manager(store_id)
+                    if not manager:
+                        continue
+                    try:
+                        if len(store_alerts) == 1:
+                            self.send_manager_notification(manager, store_alerts[0], server=server)
+                        else:
+                            self.send_manager_digest(manager, store_id, store_alerts, server=server)
+                    except Exception as e:
+                        logger.error(f"Failed to notify manager for store {store_id}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to send bulk notifications: {str(e)}")
+
+    async def send_staff_notification_async(self, staff: Employee, alert: Alert):
+        """Event-loop-safe staff notification.
+
+        aiosmtplib is not part of the dependency set, so the blocking SMTP
+        round-trip runs in the threadpool; the loop keeps serving requests.
+        """
+        await run_in_threadpool(self.send_staff_notification, staff, alert)
+
+    async def send_manager_notification_async(self, manager: Employee, alert: Alert):
+        """Event-loop-safe manager notification"""
+        await run_in_threadpool(self.send_manager_notification, manager, alert)
+
+    async def send_bulk_notifications_async(self, alerts: List[Alert]):
+        """Event-loop-safe bulk send; the whole batch shares one session"""
+        await run_in_threadpool(self.send_bulk_notifications, alerts)
 
     def send_alert_history_summary(self, manager: Employee, store_id: int, period_days: int = 7):
         """Send periodic alert history summary to store manager"""
@@ -138,71 +397,69 @@ Generated at: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S')}
         alert_stats = self._get_alert_statistics(store_id, start_date, end_date)
         
         subject = f"📊 ShelfCam Weekly Alert Summary - Store {store_id}"
-        
-        body = f"""
-Dear Store Manager,
-
-Here's your {period_days}-day alert summary:
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📊 Alert Statistics ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🔢 Total Alerts: {alert_stats['total_alerts']}
-✅ Resolved: {alert_stats['resolved_alerts']}
-⏳ Pending: {alert_stats['pending_alerts']}
-🚨 Critical: {alert_stats['critical_alerts']}
-🔴 High Priority: {alert_stats['high_priority_alerts']}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📈 Alert Types Breakdown
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        body = _SUMMARY_TMPL.substitute(
+            period_days=period_days,
+            start_date=start_date.strftime('%Y-%m-%d'),
+            end_date=end_date.strftime('%Y-%m-%d'),
+            total_alerts=alert_stats['total_alerts'],
+            resolved_alerts=alert_stats['resolved_alerts'],
+            pending_alerts=alert_stats['pending_alerts'],
+            critical_alerts=alert_stats['critical_alerts'],
+            high_priority_alerts=alert_stats['high_priority_alerts'],
+            alert_types_breakdown=self._format_alert_types_breakdown(alert_stats['alert_types']),
+            staff_performance=self._format_staff_performance(alert_stats['staff_performance'])
+        )
 
-{self._format_alert_types_breakdown(alert_stats['alert_types'])}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-👥 Staff Performance
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-{self._format_staff_performance(alert_stats['staff_performance'])}
-
-For detailed analysis, please visit your ShelfCam management dashboard.
-
-Best regards,
-ShelfCam Analytics System
-"""
-        
         self._send_email(manager.email, subject, body)
 
-    def _send_email(self, to_email: str, subject: str, body: str):
-        """Send email using SMTP"""
+    def _send_email(self, to_email: str, subject: str, body: str, server: Optional[smtplib.SMTP] = None):
+        """Send email using SMTP, reusing the given session when provided"""
+        if not self._enabled:
+            logger.debug("SMTP disabled, dropping mail to %s", to_email)
+            self._captured.append((to_email, subject))
+            return
+
         try:
             msg = MIMEMultipart()
             msg['From'] = self.from_email
             msg['To'] = to_email
             msg['Subject'] = subject
-            
+
             msg.attach(MIMEText(body, 'plain'))
-            
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
-            
             text = msg.as_string()
-            server.sendmail(self.from_email, to_email, text)
-            server.quit()
-            
+
+            if server is not None:
+                # Health-check the shared session; reconnect if the server
+                # dropped us mid-batch
+                try:
+                    server.noop()
+                except smtplib.SMTPServerDisconnected:
+                    server.connect(self.smtp_server, self.smtp_port)
+                    server.starttls()
+                    server.login(self.smtp_username, self.smtp_password)
+                server.sendmail(self.from_email, to_email, text)
+                server._messages_sent = getattr(server, '_messages_sent', 0) + 1
+            else:
+                with self._smtp_session() as session:
+                    session.sendmail(self.from_email, to_email, text)
+                    session._messages_sent = getattr(session, '_messages_sent', 0) + 1
+
             logger.info(f"Email sent successfully to {to_email}")
-            
+
         except Exception as e:
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
             raise
 
     def _get_store_manager(self, store_id: int) -> Employee:
-        """Get store manager for a specific store"""
+        """Get store manager for a specific store (cached briefly)"""
         from app.models.employee import Employee
         from app.database import SessionLocal
-        
+
+        cached = _manager_cache.get(store_id)
+        if cached and time.monotonic() - cached[0] < _MANAGER_CACHE_TTL:
+            return cached[1]
+
         db = SessionLocal()
         try:
             # Assuming manager role is identified by role field
@@ -210,6 +467,8 @@ ShelfCam Analytics System
                 Employee.store_id == store_id,
                 Employee.role == 'manager'
             ).first()
+            if manager is not None:
+                _manager_cache[store_id] = (time.monotonic(), manager)
             return manager
         finally:
             db.close()
@@ -218,23 +477,29 @@ ShelfCam Analytics System
         """Get alert statistics for a store within date range"""
         from app.models.alert import Alert
         from app.database import SessionLocal
-        from sqlalchemy import func
-        
+        from sqlalchemy import case, func
+
         db = SessionLocal()
         try:
-            # Get alerts for the store within date range
-            alerts_query = db.query(Alert).filter(
+            # One conditional-aggregation pass replaces the five COUNT scans
+            row = db.query(
+                func.count(Alert.id),
+                func.sum(case((Alert.status == 'resolved', 1), else_=0)),
+                func.sum(case((Alert.status == 'pending', 1), else_=0)),
+                func.sum(case((Alert.priority == 'critical', 1), else_=0)),
+                func.sum(case((Alert.priority == 'high', 1), else_=0))
+            ).filter(
                 Alert.store_id == store_id,
                 Alert.created_at >= start_date,
                 Alert.created_at <= end_date
-            )
-            
-            total_alerts = alerts_query.count()
-            resolved_alerts = alerts_query.filter(Alert.status == 'resolved').count()
-            pending_alerts = alerts_query.filter(Alert.status == 'pending').count()
-            critical_alerts = alerts_query.filter(Alert.priority == 'critical').count()
-            high_priority_alerts = alerts_query.filter(Alert.priority == 'high').count()
-            
+            ).one()
+
+            total_alerts = row[0] or 0
+            resolved_alerts = row[1] or 0
+            pending_alerts = row[2] or 0
+            critical_alerts = row[3] or 0
+            high_priority_alerts = row[4] or 0
+
             # Alert types breakdown
             alert_types = db.query(
                 Alert.alert_type,
@@ -244,12 +509,12 @@ ShelfCam Analytics System
                 Alert.created_at >= start_date,
                 Alert.created_at <= end_date
             ).group_by(Alert.alert_type).all()
-            
+
             # Staff performance
             staff_performance = db.query(
                 Employee.username,
                 func.count(Alert.id).label('alerts_handled'),
-                func.sum(func.case([(Alert.status == 'resolved', 1)], else_=0)).label('resolved_count')
+                func.sum(case((Alert.status == 'resolved', 1), else_=0)).label('resolved_count')
             ).join(
                 Alert, Alert.assigned_staff_id == Employee.id
             ).filter(
@@ -278,14 +543,9 @@ ShelfCam Analytics System
         
         formatted_types = []
         for alert_type, count in alert_types:
-            emoji = {
-                'low_stock': '📦',
-                'out_of_stock': '🚫',
-                'misplaced_item': '🔄',
-                'expired_product': '⏰'
-            }.get(alert_type.value, '📋')
-            
-            formatted_types.append(f"{emoji} {alert_type.value.replace('_', ' ').title()}: {count}")
+            emoji = TYPE_EMOJI.get(alert_type, '📋')
+            pretty = PRETTY_ALERT_TYPE.get(alert_type, str(alert_type))
+            formatted_types.append(f"{emoji} {pretty}: {count}")
         
         return '\n'.join(formatted_types)
 
@@ -1,58 +1,125 @@
 # app/services/websocket_service.py
-from typing import Dict, List, Optional
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Set
 from fastapi import WebSocket
 from app.models.alert import Alert
-import json
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class AlertPayload:
+    """Wire shape of a new-alert event.
+
+    orjson encodes dataclasses natively in one C-level pass, so building
+    this once per alert replaces the per-send dict literal and the enum
+    attribute chains behind it. (msgspec would go further but is not part
+    of the dependency set.)
+    """
+    id: int
+    alert_type: str
+    priority: str
+    title: str
+    message: str
+    shelf_name: str
+    rack_name: str
+    product_name: str
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class ConnInfo:
+    """Per-socket bookkeeping; slots keep the record small at high fanout"""
+    user_id: int
+    sent: int = 0
+
+
 class WebSocketService:
     def __init__(self):
-        self.active_connections: Dict[int, List[WebSocket]] = {}
-    
+        # Primary index: one slotted record per socket. The per-user index
+        # derives membership for targeted sends; both stay in lockstep via
+        # connect/disconnect so dropped sockets never linger.
+        self._by_ws: Dict[WebSocket, ConnInfo] = {}
+        self._by_user: Dict[int, Set[WebSocket]] = defaultdict(set)
+
     async def connect(self, websocket: WebSocket, user_id: int):
         """Connect user to WebSocket"""
         await websocket.accept()
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = []
-        self.active_connections[user_id].append(websocket)
+        self._by_ws[websocket] = ConnInfo(user_id)
+        self._by_user[user_id].add(websocket)
         logger.info(f"User {user_id} connected to WebSocket")
     
     def disconnect(self, websocket: WebSocket, user_id: int):
         """Disconnect user from WebSocket"""
-        if user_id in self.active_connections:
-            if websocket in self.active_connections[user_id]:
-                self.active_connections[user_id].remove(websocket)
-            if not self.active_connections[user_id]:
-                del self.active_connections[user_id]
+        self._by_ws.pop(websocket, None)
+        connections = self._by_user.get(user_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self._by_user[user_id]
         logger.info(f"User {user_id} disconnected from WebSocket")
     
     async def send_alert_to_user(self, user_id: int, alert: Alert):
         """Send alert to specific user"""
-        if user_id in self.active_connections:
+        if user_id in self._by_user:
             message = {
                 "type": "new_alert",
-                "data": {
-                    "id": alert.id,
-                    "alert_type": alert.alert_type.value,
-                    "priority": alert.priority.value,
-                    "title": alert.title,
-                    "message": alert.message,
-                    "shelf_name": alert.shelf_name,
-                    "rack_name": alert.rack_name,
-                    "product_name": alert.product_name,
-                    "created_at": alert.created_at.isoformat()
-                }
+                "data": AlertPayload(
+                    id=alert.id,
+                    alert_type=alert.alert_type.value,
+                    priority=alert.priority.value,
+                    title=alert.title,
+                    message=alert.message,
+                    shelf_name=alert.shelf_name,
+                    rack_name=alert.rack_name,
+                    product_name=alert.product_name,
+                    created_at=alert.created_at
+                )
             }
             
-            for websocket in self.active_connections[user_id][:]:  # Copy list to avoid modification during iteration
-                try:
-                    await websocket.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error sending alert to user {user_id}: {e}")
-                    self.active_connections[user_id].remove(websocket)
+            # Serialize once with orjson, send the same bytes to every socket
+            payload = orjson.dumps(message)
+            websockets = list(self._by_user[user_id])
+            results = await asyncio.gather(
+                *(websocket.send_bytes(payload) for websocket in websockets),
+                return_exceptions=True
+            )
+            for websocket, result in zip(websockets, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending alert to user {user_id}: {result}")
+                    self.disconnect(websocket, user_id)
+                else:
+                    info = self._by_ws.get(websocket)
+                    if info is not None:
+                        info.sent += 1
     
+    async def _broadcast(self, payload: bytes):
+        """Send one pre-serialized payload to every connected socket.
+
+        The sends are independent, so they fan out through asyncio.gather -
+        broadcast wall time becomes max(RTT) instead of the sum - and any
+        socket that errored is pruned in a single pass afterwards.
+        """
+        targets = list(self._by_ws.items())
+        if not targets:
+            return
+
+        results = await asyncio.gather(
+            *(websocket.send_bytes(payload) for websocket, _ in targets),
+            return_exceptions=True
+        )
+        for (websocket, info), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to user {info.user_id}: {result}")
+                self.disconnect(websocket, info.user_id)
+            else:
+                info.sent += 1
+
     async def send_alert_update(self, alert: Alert):
         """Send alert update to all connected users"""
         message = {
@@ -60,18 +127,12 @@ class WebSocketService:
             "data": {
                 "id": alert.id,
                 "status": alert.status.value,
-                "acknowledged_at": alert.acknowledged_at.isoformat() if alert.acknowledged_at else None,
-                "resolved_at": alert.resolved_at.isoformat() if alert.resolved_at else None
+                "acknowledged_at": alert.acknowledged_at,
+                "resolved_at": alert.resolved_at
             }
         }
         
-        for user_id, websockets in self.active_connections.items():
-            for websocket in websockets[:]:
-                try:
-                    await websocket.send_text(json.dumps(message))
-                except Exception as e:
-                    logger.error(f"Error sending alert update to user {user_id}: {e}")
-                    websockets.remove(websocket)
+        await self._broadcast(orjson.dumps(message))
     
     async def broadcast_system_message(self, message: str):
         """Broadcast system message to all connected users"""
@@ -79,14 +140,8 @@ class WebSocketService:
             "type": "system_message",
             "data": {
                 "message": message,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }
         }
         
-        for user_id, websockets in self.active_connections.items():
-            for websocket in websockets[:]:
-                try:
-                    await websocket.send_text(json.dumps(broadcast_message))
-                except Exception as e:
-                    logger.error(f"Error broadcasting to user {user_id}: {e}")
-                    websockets.remove(websocket)
\ No newline at end of file
+        await self._broadcast(orjson.dumps(broadcast_message))
\ No newline at end of file
@@ -4,10 +4,22 @@ import os
 # Create database directory if it doesn't exist
 os.makedirs('database', exist_ok=True)
 
+TEST_USERS = [
+    ('E101', 'john_doe', 'password123', 'staff', 'john@example.com', '1234567890', 1),
+    ('M001', 'manager1', 'manager123', 'manager', 'manager@example.com', '0987654321', 1),
+    ('A001', 'admin1', 'admin123', 'admin', 'admin@example.com', '1122334455', 1),
+]
+
 try:
     conn = sqlite3.connect('./database/sqlite.db')
     cursor = conn.cursor()
-    
+
+    # WAL + NORMAL skip the per-transaction fsync stall of the DELETE/FULL
+    # defaults - the bulk of wall time on setup and test resets
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+
     # Create employees table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS employees (
@@ -21,21 +33,18 @@ try:
             is_active BOOLEAN DEFAULT 1
         )
     """)
-    
-    # Insert test users
-    cursor.execute("""
-        INSERT OR IGNORE INTO employees (employee_id, username, password, role, email, phone, is_active) 
-        VALUES 
-        ('E101', 'john_doe', 'password123', 'staff', 'john@example.com', '1234567890', 1),
-        ('M001', 'manager1', 'manager123', 'manager', 'manager@example.com', '0987654321', 1),
-        ('A001', 'admin1', 'admin123', 'admin', 'admin@example.com', '1122334455', 1)
-    """)
-    
+
+    # Insert test users in one transaction
+    cursor.executemany("""
+        INSERT OR IGNORE INTO employees (employee_id, username, password, role, email, phone, is_active)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, TEST_USERS)
+
     conn.commit()
     print("✅ Test users inserted successfully!")
-    
+
     cursor.close()
     conn.close()
-    
+
 except Exception as e:
-    print("❌ Error:", e)
\ No newline at end of file
+    print("❌ Error:", e)
@@ -0,0 +1,10 @@
+# gunicorn_conf.py - production server settings
+# Run with: gunicorn app.main:app -c gunicorn_conf.py
+# (or directly: uvicorn app.main:app --loop uvloop --http httptools --workers N)
+import multiprocessing
+
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = multiprocessing.cpu_count()
+keepalive = 5
+backlog = 2048
+bind = "0.0.0.0:8000"
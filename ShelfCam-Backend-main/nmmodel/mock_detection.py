@@ -1,8 +1,12 @@
 import sys
-import json
+import orjson
 from pathlib import Path
 import random
 
+# Private RNG instance; avoids contending on the global random module state
+# when mock detections run from parallel workers
+_rng = random.Random()
+
 def run_inference(image_path: str, shelf_number: str = "A1"):
     """Mock AI detection for testing purposes"""
     
@@ -12,8 +16,8 @@ def run_inference(image_path: str, shelf_number: str = "A1"):
     
     # Generate mock detection results
     mock_items = ["Apple", "Banana", "Orange", "Milk", "Bread", "Cereal"]
-    detected_items = random.sample(mock_items, random.randint(1, 4))
-    empty_percentage = random.uniform(10, 60)
+    detected_items = _rng.sample(mock_items, _rng.randint(1, 4))
+    empty_percentage = _rng.uniform(10, 60)
     
     output_data = {
         "shelf_number": shelf_number,
@@ -23,14 +27,17 @@ def run_inference(image_path: str, shelf_number: str = "A1"):
         "message": "This is a mock detection result for testing"
     }
     
-    # Save results
-    with open(outputs_dir / "output.json", "w") as f:
-        json.dump(output_data, f, indent=4)
-    
+    # Save results: one C-level encode, one write syscall
+    (outputs_dir / "output.json").write_bytes(
+        orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+    )
+
     print(f"Mock detection completed for {image_path}")
     print(f"Detected items: {detected_items}")
     print(f"Empty percentage: {empty_percentage:.2f}%")
 
+    return output_data
+
 if __name__ == "__main__":
     image_path = sys.argv[1]
     shelf_number = sys.argv[2] if len(sys.argv) > 2 else "A1"
@@ -1,17 +1,16 @@
 # NNMODEL/old1.py
 import sys
 from pathlib import Path
-from ultralytics import YOLO
 import cv2
 import json
+import numpy as np
 
 def run_inference(image_path: str, shelf_number: str = "A1"):
-    # Load model
-    base_dir = Path(__file__).resolve().parent
-    model_path = base_dir / "best.pt"
+    # Model stays warm across calls within one process (see worker.py);
+    # only a cold CLI invocation pays the load
+    from worker import get_model
 
-    # Run inference
-    model = YOLO(str(model_path))
+    model = get_model()
     results = model(image_path)[0]
 
     # Load original image
@@ -21,24 +20,26 @@ def run_inference(image_path: str, shelf_number: str = "A1"):
 
     height, width = image.shape[:2]
     total_area = width * height
-    empty_area = 0
-    item_classes = set()
 
-    for box in results.boxes:
-        x1, y1, x2, y2 = map(int, box.xyxy[0])
-        conf = float(box.conf[0])
-        cls_id = int(box.cls[0])
-        class_name = model.names[cls_id]
+    # Pull all boxes back to NumPy once; class filtering and area math run
+    # vectorized, and Python only loops over the boxes that need drawing
+    boxes = results.boxes.xyxy.cpu().numpy().astype(np.int32)
+    classes = results.boxes.cls.cpu().numpy().astype(np.int32)
+    confidences = results.boxes.conf.cpu().numpy()
 
-        if class_name.lower() == "empty":
-            area = (x2 - x1) * (y2 - y1)
-            empty_area += area
-        else:
-            item_classes.add(class_name)
-            label = f"{class_name} ({conf*100:.1f}%)"
-            cv2.rectangle(image, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            cv2.putText(image, label, (x1, y1 - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    names = model.names
+    empty_mask = np.array([names[cls_id].lower() == "empty" for cls_id in classes], dtype=bool)
+
+    widths_heights = boxes[:, 2:] - boxes[:, :2]
+    empty_area = int((widths_heights[empty_mask, 0] * widths_heights[empty_mask, 1]).sum())
+
+    item_classes = {names[cls_id] for cls_id in classes[~empty_mask]}
+
+    for (x1, y1, x2, y2), cls_id, conf in zip(boxes[~empty_mask], classes[~empty_mask], confidences[~empty_mask]):
+        label = f"{names[cls_id]} ({conf*100:.1f}%)"
+        cv2.rectangle(image, (x1, y1), (x2, y2), (0, 255, 0), 2)
+        cv2.putText(image, label, (x1, y1 - 10),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
     empty_percentage = (empty_area / total_area) * 100
     cv2.putText(image, f"Empty: {empty_percentage:.2f}%", (30, 50),
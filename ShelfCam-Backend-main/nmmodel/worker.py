@@ -0,0 +1,90 @@
+# nmmodel/worker.py - long-lived YOLO worker: load the model once, infer many
+#
+# Model init (weights + CUDA context) costs ~1s while per-image inference is
+# milliseconds, so the subprocess-per-image pattern pays startup every call.
+# Import this module inside a persistent process (e.g. the model pool workers
+# in app/services/model_runner.py) and the weights stay warm across requests.
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+_MODEL = None
+_EMPTY_CLASS_ID = None
+_USE_HALF = False
+
+
+def export_engine(half: bool = True):
+    """One-time TensorRT export; get_model prefers best.engine when present.
+
+    Run on the deployment GPU: kernel fusion plus FP16 roughly doubles
+    throughput over the FP32 .pt path. For INT8, pass a calibration set via
+    Ultralytics' int8/data options instead.
+    """
+    from ultralytics import YOLO
+    base_dir = Path(__file__).resolve().parent
+    YOLO(str(base_dir / "best.pt")).export(format='engine', half=half, imgsz=640)
+
+
+def get_model():
+    """Load the YOLO weights once per process, preferring the TensorRT engine"""
+    global _MODEL, _EMPTY_CLASS_ID, _USE_HALF
+    if _MODEL is None:
+        from ultralytics import YOLO
+
+        try:
+            import torch
+            _USE_HALF = torch.cuda.is_available()
+            # Fixed input size per deploy; let cuDNN pick the fastest kernels
+            torch.backends.cudnn.benchmark = True
+        except ImportError:
+            _USE_HALF = False
+
+        base_dir = Path(__file__).resolve().parent
+        engine_path = base_dir / "best.engine"
+        weights = engine_path if engine_path.exists() else base_dir / "best.pt"
+        _MODEL = YOLO(str(weights))
+        _EMPTY_CLASS_ID = next(
+            (cls_id for cls_id, name in _MODEL.names.items() if name.lower() == "empty"),
+            None
+        )
+    return _MODEL
+
+
+def infer_batch(image_paths, shelf_numbers=None):
+    """Run one batched forward pass over several images.
+
+    Batching amortizes per-call GPU launch overhead; results come back as
+    the same payload dicts the alert pipeline consumes.
+    """
+    model = get_model()
+    if shelf_numbers is None:
+        shelf_numbers = ["A1"] * len(image_paths)
+
+    results = model(image_paths, batch=len(image_paths), half=_USE_HALF)
+
+    payloads = []
+    for image_path, shelf_number, result in zip(image_paths, shelf_numbers, results):
+        image = cv2.imread(image_path)
+        if image is None:
+            raise Exception("Image not found:", image_path)
+
+        height, width = image.shape[:2]
+        total_area = width * height
+
+        # Vectorized class filtering and area math; no per-box Python loop
+        boxes = result.boxes.xyxy.cpu().numpy().astype(np.int32)
+        classes = result.boxes.cls.cpu().numpy().astype(np.int32)
+        empty_mask = classes == _EMPTY_CLASS_ID
+
+        widths_heights = boxes[:, 2:] - boxes[:, :2]
+        empty_area = int((widths_heights[empty_mask, 0] * widths_heights[empty_mask, 1]).sum())
+        item_classes = {model.names[cls_id] for cls_id in classes[~empty_mask]}
+
+        payloads.append({
+            "shelf_number": shelf_number,
+            "empty_percentage": round((empty_area / total_area) * 100, 2),
+            "items_detected": sorted(item_classes)
+        })
+
+    return payloads